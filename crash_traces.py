@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Crash Trace Generator
+Synthetic MPU6050 accelerometer corpus for crash detection benchmarking
+
+Synthesizes labeled 3-axis acceleration traces for a library of driving
+scenarios, emulating the sensor configuration in STM.ino: ±16 G range,
+5 Hz digital low-pass filter and a 20 ms sampling loop. Traces are stored as
+raw int16 register counts in a memory-mapped .npy corpus that SystemEvaluator
+can evaluate directly with the same fall + impact algorithm as the firmware.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+GRAVITY = 9.80665  # m/s^2
+SAMPLE_PERIOD_MS = 20  # delay(20) in the STM32 loop
+TRACE_DURATION_MS = 3000
+NUM_SAMPLES = TRACE_DURATION_MS // SAMPLE_PERIOD_MS
+OVERSAMPLE = 4  # Physical signal is synthesized at 200 Hz before filtering
+FILTER_CUTOFF_HZ = 5.0  # MPU6050_BAND_5_HZ
+LSB_PER_G = 2048  # MPU6050_RANGE_16_G sensitivity
+SENSOR_NOISE_G = 0.01
+
+# Detection thresholds from STM.ino
+FREEFALL_THRESHOLD = 5.0  # m/s^2
+IMPACT_THRESHOLD = 14.0  # m/s^2
+MAX_FALL_TIME_MS = 1000
+
+LABEL_DTYPE = np.dtype([
+    ('scenario', np.uint8),
+    ('is_crash', np.bool_),
+    ('onset_ms', np.uint16),  # Start of the scenario's event within the trace
+    ('impact_ms', np.uint16),  # Start of the impact the detector responds to (landing, floor strike, ...)
+])
+
+TRACES_FILENAME = 'traces.npy'
+LABELS_FILENAME = 'labels.npy'
+
+
+def _uniform(rng: np.random.Generator, bounds: Tuple[float, float], n: int) -> np.ndarray:
+    """Per-trace float32 parameter drawn uniformly from bounds, shape (n, 1)"""
+    return rng.uniform(bounds[0], bounds[1], (n, 1)).astype(np.float32)
+
+
+def _pulse(t: np.ndarray, onset: np.ndarray, duration: np.ndarray) -> np.ndarray:
+    """Half-sine pulse of unit height for each trace, shape (n, len(t))"""
+    phase = (t - onset) / duration
+    return np.where((phase >= 0) & (phase < 1), np.sin(np.pi * np.clip(phase, 0, 1)), 0).astype(np.float32)
+
+
+def _window(t: np.ndarray, onset: np.ndarray, duration: np.ndarray) -> np.ndarray:
+    """1.0 inside [onset, onset + duration) for each trace, else 0.0"""
+    return ((t >= onset) & (t < onset + duration)).astype(np.float32)
+
+
+def _normal_driving(acc, t, onset, rng, p):
+    """Gentle acceleration, cornering and road vibration only"""
+    n = len(acc)
+    phase = _uniform(rng, (0, 2 * np.pi), n)
+    freq = _uniform(rng, (0.1, 0.5), n)
+    acc[..., 0] += p['longitudinal_g'] * GRAVITY * np.sin(2 * np.pi * freq * t + phase)
+    acc[..., 1] += p['lateral_g'] * GRAVITY * np.sin(2 * np.pi * freq * 0.7 * t + 2 * phase)
+    return onset
+
+
+def _pothole(acc, t, onset, rng, p):
+    """Short vertical jolt: brief unloading followed by a compression spike"""
+    n = len(acc)
+    duration = _uniform(rng, p['duration_s'], n)
+    peak = _uniform(rng, p['peak_g'], n) * GRAVITY
+    acc[..., 2] -= 0.5 * GRAVITY * _pulse(t, onset, duration / 2)
+    acc[..., 2] += peak * _pulse(t, onset + duration / 2, duration)
+    return onset + duration / 2
+
+
+def _hard_braking(acc, t, onset, rng, p):
+    """Sustained longitudinal deceleration"""
+    n = len(acc)
+    duration = _uniform(rng, p['duration_s'], n)
+    decel = _uniform(rng, p['decel_g'], n) * GRAVITY
+    ramp = np.clip((t - onset) / 0.2, 0, 1)
+    acc[..., 0] -= decel * ramp * (t < onset + duration)
+    return onset
+
+
+def _phone_drop(acc, t, onset, rng, p):
+    """Device in free fall, then a sharp impact with the floor"""
+    n = len(acc)
+    fall = _uniform(rng, p['fall_s'], n)
+    impact = _uniform(rng, p['impact_g'], n) * GRAVITY
+    falling = _window(t, onset, fall)
+    acc *= (1 - falling)[..., np.newaxis]
+    acc[..., 2] += impact * _pulse(t, onset + fall, p['impact_duration_s'])
+    return onset + fall
+
+
+def _rollover(acc, t, onset, rng, p):
+    """Vehicle rolls about its long axis with airborne phases and ground impacts"""
+    n = len(acc)
+    duration = _uniform(rng, p['duration_s'], n)
+    airborne = _uniform(rng, p['airborne_s'], n)
+    impact = _uniform(rng, p['impact_g'], n) * GRAVITY
+
+    angle = np.pi * np.clip((t - onset) / duration, 0, 1) * rng.choice([1, 2], (n, 1))
+    acc[..., 1] += GRAVITY * np.sin(angle)
+    acc[..., 2] += GRAVITY * (np.cos(angle) - 1)
+    acc *= (1 - _window(t, onset + duration / 3, airborne))[..., np.newaxis]
+    landing = onset + duration / 3 + airborne
+    acc[..., 1] += impact * _pulse(t, landing, p['impact_duration_s'])
+    acc[..., 2] += impact * 0.7 * _pulse(t, landing, p['impact_duration_s'])
+    return landing
+
+
+def _frontal_impact(acc, t, onset, rng, p):
+    """Barrier-style crash pulse along the longitudinal axis"""
+    n = len(acc)
+    duration = _uniform(rng, p['duration_s'], n)
+    peak = _uniform(rng, p['peak_g'], n) * GRAVITY
+    acc[..., 0] -= peak * _pulse(t, onset, duration)
+    # Vehicle pitches and briefly unloads the suspension during rebound
+    acc[..., 2] -= p['rebound_g'] * GRAVITY * _pulse(t, onset + duration, duration * 3)
+    return onset
+
+
+# Scenario library: generator, crash label and default parameters (ranges are uniform)
+SCENARIOS = {
+    'normal_driving': {'generator': _normal_driving, 'is_crash': False,
+                       'params': {'longitudinal_g': 0.15, 'lateral_g': 0.1}},
+    'pothole': {'generator': _pothole, 'is_crash': False,
+                'params': {'duration_s': (0.03, 0.08), 'peak_g': (2.0, 4.0)}},
+    'hard_braking': {'generator': _hard_braking, 'is_crash': False,
+                     'params': {'duration_s': (1.0, 2.0), 'decel_g': (0.7, 1.0)}},
+    'phone_drop': {'generator': _phone_drop, 'is_crash': False,
+                   'params': {'fall_s': (0.2, 0.5), 'impact_g': (5.0, 12.0), 'impact_duration_s': 0.02}},
+    'rollover': {'generator': _rollover, 'is_crash': True,
+                 'params': {'duration_s': (1.0, 2.0), 'airborne_s': (0.2, 0.5), 'impact_g': (8.0, 20.0),
+                            'impact_duration_s': 0.06}},
+    'frontal_impact': {'generator': _frontal_impact, 'is_crash': True,
+                       'params': {'duration_s': (0.08, 0.15), 'peak_g': (20.0, 60.0), 'rebound_g': 0.8}},
+}
+SCENARIO_NAMES = list(SCENARIOS)
+
+
+def _low_pass(signal: np.ndarray, dt: float, cutoff_hz: float = FILTER_CUTOFF_HZ) -> np.ndarray:
+    """Second-order (two cascaded RC stages) low-pass filter along the time axis"""
+    alpha = dt / (1 / (2 * np.pi * cutoff_hz) + dt)
+    samples = np.ascontiguousarray(signal.transpose(1, 0, 2))  # Time-major for contiguous steps
+    stage1 = samples[0].copy()
+    stage2 = samples[0].copy()
+    for i in range(len(samples)):
+        stage1 += alpha * (samples[i] - stage1)
+        stage2 += alpha * (stage1 - stage2)
+        samples[i] = stage2
+    return samples.transpose(1, 0, 2)
+
+
+def synthesize_traces(scenario: str, num_traces: int, rng: Optional[np.random.Generator] = None,
+                      params: Optional[Dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Synthesize MPU6050 readings for one scenario
+
+    Returns (traces, labels): int16 register counts of shape
+    (num_traces, NUM_SAMPLES, 3) and LABEL_DTYPE records.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    spec = SCENARIOS[scenario]
+    scenario_params = {**spec['params'], **(params or {})}
+
+    num_internal = NUM_SAMPLES * OVERSAMPLE
+    dt = SAMPLE_PERIOD_MS / 1000 / OVERSAMPLE
+    t = (np.arange(num_internal) * dt).astype(np.float32)
+    onset = _uniform(rng, (0.5, 1.5), num_traces)
+
+    # Engine and road vibration on top of gravity
+    acc = rng.standard_normal((num_traces, num_internal, 3), dtype=np.float32)
+    acc *= 0.05 * GRAVITY
+    acc[..., 2] += GRAVITY
+    impact = spec['generator'](acc, t, onset, rng, scenario_params)
+
+    filtered = _low_pass(acc, dt)[:, OVERSAMPLE - 1::OVERSAMPLE]
+    filtered += rng.standard_normal(filtered.shape, dtype=np.float32) * (SENSOR_NOISE_G * GRAVITY)
+    counts = np.clip(np.rint(filtered / GRAVITY * LSB_PER_G), -32768, 32767).astype(np.int16)
+
+    labels = np.empty(num_traces, dtype=LABEL_DTYPE)
+    labels['scenario'] = SCENARIO_NAMES.index(scenario)
+    labels['is_crash'] = spec['is_crash']
+    labels['onset_ms'] = np.rint(onset[:, 0] * 1000)
+    labels['impact_ms'] = np.rint(np.minimum(impact[:, 0], TRACE_DURATION_MS / 1000) * 1000)
+    return counts, labels
+
+
+def _write_chunk(task) -> int:
+    """Synthesize one chunk into an existing corpus (executed in a worker process)"""
+    directory, scenario, offset, count, seed, params = task
+    traces = np.load(os.path.join(directory, TRACES_FILENAME), mmap_mode='r+')
+    labels = np.load(os.path.join(directory, LABELS_FILENAME), mmap_mode='r+')
+    traces[offset:offset + count], labels[offset:offset + count] = synthesize_traces(
+        scenario, count, np.random.default_rng(seed), params)
+    traces.flush()
+    labels.flush()
+    return count
+
+
+def generate_corpus(directory: str, scenario_counts: Dict[str, int], chunk_size: int = 5_000,
+                    seed: Optional[int] = None, scenario_params: Optional[Dict[str, Dict]] = None,
+                    workers: Optional[int] = None) -> str:
+    """Write a labeled trace corpus to memory-mapped .npy files, chunks generated in parallel"""
+    scenario_params = scenario_params or {}
+    total = sum(scenario_counts.values())
+    os.makedirs(directory, exist_ok=True)
+
+    # Allocate the corpus files up front so workers can fill disjoint slices
+    np.lib.format.open_memmap(os.path.join(directory, TRACES_FILENAME), mode='w+',
+                              dtype=np.int16, shape=(total, NUM_SAMPLES, 3)).flush()
+    np.lib.format.open_memmap(os.path.join(directory, LABELS_FILENAME), mode='w+',
+                              dtype=LABEL_DTYPE, shape=(total,)).flush()
+
+    tasks = []
+    offset = 0
+    for scenario, count in scenario_counts.items():
+        for start in range(0, count, chunk_size):
+            n = min(chunk_size, count - start)
+            tasks.append([directory, scenario, offset, n, None, scenario_params.get(scenario)])
+            offset += n
+    for task, child_seed in zip(tasks, np.random.SeedSequence(seed).spawn(len(tasks))):
+        task[4] = child_seed
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            _write_chunk(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_write_chunk, tasks))
+    return directory
+
+
+def load_corpus(directory: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Open a corpus read-only as memory-mapped (traces, labels) arrays"""
+    traces = np.load(os.path.join(directory, TRACES_FILENAME), mmap_mode='r')
+    labels = np.load(os.path.join(directory, LABELS_FILENAME), mmap_mode='r')
+    return traces, labels
+
+
+def iter_corpus(directory: str, chunk_size: int = 100_000) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield (traces, labels) chunks of a corpus without loading it into memory"""
+    traces, labels = load_corpus(directory)
+    for start in range(0, len(labels), chunk_size):
+        yield traces[start:start + chunk_size], labels[start:start + chunk_size]
+
+
+def sample_time_ms(index: np.ndarray) -> np.ndarray:
+    """Trace time of a stored sample: the last 200 Hz point of its 20 ms decimation window"""
+    return (np.asarray(index) * OVERSAMPLE + OVERSAMPLE - 1) * SAMPLE_PERIOD_MS / OVERSAMPLE
+
+
+def detect_crashes(traces: np.ndarray) -> np.ndarray:
+    """Run the STM.ino fall + impact state machine over every trace
+
+    Returns the sample index at which CRASH_PIN would first go high, or -1.
+    """
+    magnitude = np.sqrt(np.sum((traces.astype(np.float32) / LSB_PER_G * GRAVITY) ** 2, axis=2))
+    num_traces, num_samples = magnitude.shape
+    max_fall_samples = MAX_FALL_TIME_MS // SAMPLE_PERIOD_MS
+
+    falling = np.zeros(num_traces, dtype=bool)
+    fall_start = np.zeros(num_traces, dtype=np.int64)
+    detected_at = np.full(num_traces, -1, dtype=np.int64)
+    for i in range(num_samples):
+        mag = magnitude[:, i]
+        start_fall = ~falling & (mag < FREEFALL_THRESHOLD)
+        falling |= start_fall
+        fall_start[start_fall] = i
+
+        impact = falling & (i - fall_start < max_fall_samples) & (mag > IMPACT_THRESHOLD)
+        detected_at[impact & (detected_at < 0)] = i
+        falling &= ~impact
+        falling &= i - fall_start < max_fall_samples  # Fall timeout, no crash
+    return detected_at
+
+
+def main():
+    """Generate a crash trace corpus and report detection performance per scenario"""
+    parser = argparse.ArgumentParser(description="Synthetic MPU6050 crash trace corpus generator")
+    parser.add_argument('--output', default='crash_corpus', help="Corpus directory")
+    parser.add_argument('--traces-per-scenario', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Crash Trace Corpus Generator")
+    print("=" * 60)
+
+    counts = {name: args.traces_per_scenario for name in SCENARIO_NAMES}
+    start_time = time.time()
+    generate_corpus(args.output, counts, seed=args.seed, workers=args.workers)
+    total = sum(counts.values())
+    elapsed = time.time() - start_time
+    print(f"Generated {total:,} traces in {elapsed:.1f}s ({total / elapsed:,.0f} traces/s) -> {args.output}")
+
+    detected = np.zeros(len(SCENARIO_NAMES))
+    seen = np.zeros(len(SCENARIO_NAMES))
+    for traces, labels in iter_corpus(args.output):
+        hits = detect_crashes(traces) >= 0
+        seen += np.bincount(labels['scenario'], minlength=len(SCENARIO_NAMES))
+        detected += np.bincount(labels['scenario'], weights=hits, minlength=len(SCENARIO_NAMES))
+
+    print("\nSTM32 fall + impact detection rate by scenario:")
+    for i, name in enumerate(SCENARIO_NAMES):
+        kind = 'crash' if SCENARIOS[name]['is_crash'] else 'non-crash'
+        print(f"   {name:<16} ({kind:<9}) {detected[i] / seen[i] * 100:6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Emergency Dispatch Simulator
+Asyncio model of the emergency alert pipeline under mass-casualty load
+
+Mirrors the flow in HospitalService.kt (hospital lookup, hospital contact
+info fetch, SMS to each emergency contact) against a local stub gateway,
+with per-provider rate limits, timeouts and retries. Runs on a virtual-clock
+event loop, so latencies are simulated seconds that cost no wall time.
+"""
+
+import asyncio
+import selectors
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Stub provider behaviour; the app's sequential lookup, contact fetch and SMS adds up to ~6.2s.
+# Capacity is below rate_limit * latency, so sustained bursts queue at the provider as well as the limiter
+PROVIDERS = {
+    'geoapify': {'latency': 2.1, 'jitter': 0.5, 'failure_rate': 0.02, 'rate_limit': 5.0, 'burst': 5, 'capacity': 8},
+    'gomaps': {'latency': 1.1, 'jitter': 0.3, 'failure_rate': 0.05, 'rate_limit': 10.0, 'burst': 10, 'capacity': 8},
+    'sms': {'latency': 1.8, 'jitter': 0.4, 'failure_rate': 0.019, 'rate_limit': 30.0, 'burst': 30, 'capacity': 40},
+}
+
+DEFAULT_TIMEOUTS = {'geoapify': 5.0, 'gomaps': 4.0, 'sms': 6.0}  # seconds
+DEFAULT_BURST_SIZES = [1, 10, 100, 1000, 5000]
+
+
+class GatewayError(Exception):
+    """Raised by the stub gateway for a failed provider request"""
+
+
+class _VirtualClockSelector(selectors.DefaultSelector):
+    """Selector that advances the loop's virtual clock instead of blocking"""
+
+    def __init__(self):
+        super().__init__()
+        self.clock = 0.0
+
+    def select(self, timeout=None):
+        events = super().select(0)
+        if not events and timeout:
+            self.clock += timeout
+        return events
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose time() jumps straight to the next scheduled callback"""
+
+    def __init__(self):
+        self._virtual_selector = _VirtualClockSelector()
+        super().__init__(self._virtual_selector)
+
+    def time(self) -> float:
+        return self._virtual_selector.clock
+
+
+def run_simulation(coro):
+    """Run a coroutine to completion on a fresh VirtualTimeEventLoop"""
+    loop = VirtualTimeEventLoop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class RateLimiter:
+    """Token-bucket rate limiter (GCRA) for a single provider"""
+
+    def __init__(self, rate: float, burst: int):
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+        self._tat = 0.0  # Theoretical arrival time of the next request
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Reserve the next request slot, returning the wait before it may be sent
+
+        Returns None without reserving anything if the wait would exceed
+        max_wait, so callers past their deadline do not consume the rate.
+        """
+        now = asyncio.get_running_loop().time()
+        tat = max(self._tat, now)
+        wait = max(tat - self.tolerance - now, 0.0)
+        if wait > max_wait:
+            return None
+        self._tat = tat + self.interval
+        return wait
+
+    async def acquire(self, max_wait: float = float('inf')) -> bool:
+        """Wait until the provider's rate limit allows another request (False if beyond max_wait)"""
+        wait = self.reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+
+class StubGateway:
+    """Local stand-in for Geoapify, GoMaps and the SMS gateway
+
+    Each provider serves at most `capacity` requests at once; extra requests
+    queue, which is how response time degrades under load.
+    """
+
+    def __init__(self, providers: Dict = None, seed: Optional[int] = None):
+        self.providers = providers or PROVIDERS
+        self.rng = np.random.default_rng(seed)
+        self._slots = {name: asyncio.Semaphore(cfg['capacity']) for name, cfg in self.providers.items()}
+
+    async def request(self, provider: str):
+        """Serve one request, raising GatewayError on a simulated failure"""
+        cfg = self.providers[provider]
+        async with self._slots[provider]:
+            latency = abs(self.rng.normal(cfg['latency'], cfg['jitter']))
+            await asyncio.sleep(latency)
+            if self.rng.random() < cfg['failure_rate']:
+                raise GatewayError(f"{provider} request failed")
+
+
+class DispatchPipeline:
+    """Concurrent emergency alert dispatch against a StubGateway"""
+
+    def __init__(self, gateway: StubGateway, timeouts: Dict = None,
+                 max_retries: int = 2, backoff: float = 0.5):
+        self.gateway = gateway
+        self.timeouts = timeouts or DEFAULT_TIMEOUTS
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.limiters = {
+            name: RateLimiter(cfg['rate_limit'], cfg['burst'])
+            for name, cfg in gateway.providers.items()
+        }
+        self.stats = {'requests': 0, 'timeouts': 0, 'failures': 0, 'retries': 0}
+
+    async def call(self, provider: str) -> bool:
+        """Call a provider with rate limiting, timeout and exponential-backoff retries
+
+        The timeout covers the whole attempt: waiting for the rate limiter,
+        queueing for provider capacity and the request itself.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.timeouts[provider]
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            start = loop.time()
+            if not await self.limiters[provider].acquire(max_wait=timeout):
+                self.stats['timeouts'] += 1  # Throttled past the deadline, never sent
+                continue
+            self.stats['requests'] += 1
+            try:
+                await asyncio.wait_for(self.gateway.request(provider), timeout - (loop.time() - start))
+                return True
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+            except GatewayError:
+                self.stats['failures'] += 1
+        return False
+
+    async def _notify_hospital(self) -> bool:
+        """Fetch hospital contact info (text search + place details), then SMS the hospital"""
+        if not await self.call('gomaps') or not await self.call('gomaps'):
+            return False
+        return await self.call('sms')
+
+    async def dispatch(self, num_contacts: int, arrival: float = 0.0) -> Dict:
+        """Dispatch one crash alert and return its timings in seconds"""
+        loop = asyncio.get_running_loop()
+        if arrival:
+            await asyncio.sleep(arrival)
+        start = loop.time()
+
+        hospital_found = await self.call('geoapify')
+        hospital_task = asyncio.ensure_future(self._notify_hospital()) if hospital_found else None
+        delivered = await asyncio.gather(*(self.call('sms') for _ in range(num_contacts)))
+        dispatch_time = loop.time() - start
+        hospital_notified = await hospital_task if hospital_task is not None else False
+
+        return {
+            'dispatch_time': dispatch_time,
+            'completion_time': loop.time() - start,
+            'contacts_delivered': sum(delivered),
+            'num_contacts': num_contacts,
+            'hospital_found': hospital_found,
+            'hospital_notified': hospital_notified,
+        }
+
+
+async def _run_burst(num_crashes: int, num_contacts: int, arrival_window: float,
+                     seed: Optional[int], include_outcomes: bool = False) -> Dict:
+    """Dispatch a burst of crashes through a fresh pipeline"""
+    gateway = StubGateway(seed=seed)
+    pipeline = DispatchPipeline(gateway)
+    arrivals = gateway.rng.uniform(0, arrival_window, num_crashes) if arrival_window else np.zeros(num_crashes)
+
+    wall_start = time.perf_counter()
+    outcomes = await asyncio.gather(*(pipeline.dispatch(num_contacts, a) for a in arrivals))
+    wall_time = time.perf_counter() - wall_start
+
+    df = pd.DataFrame(outcomes)
+    results = {
+        'burst_size': num_crashes,
+        'avg_dispatch_time': float(df['dispatch_time'].mean()),
+        'p95_dispatch_time': float(df['dispatch_time'].quantile(0.95)),
+        'max_dispatch_time': float(df['dispatch_time'].max()),
+        'avg_completion_time': float(df['completion_time'].mean()),
+        'contact_delivery_rate': float(df['contacts_delivered'].sum() / df['num_contacts'].sum() * 100),
+        'hospital_info_success_rate': float(df['hospital_notified'].mean() * 100),
+        'requests': pipeline.stats['requests'],
+        'retries': pipeline.stats['retries'],
+        'timeouts': pipeline.stats['timeouts'],
+        'failures': pipeline.stats['failures'],
+        'wall_time': wall_time,
+    }
+    if include_outcomes:
+        results['outcomes'] = df  # One row per crash
+    return results
+
+
+def simulate_dispatch_burst(num_crashes: int, num_contacts: int = 2, arrival_window: float = 0.0,
+                            seed: Optional[int] = None, include_outcomes: bool = False) -> Dict:
+    """Simulate `num_crashes` crashes arriving within `arrival_window` seconds
+
+    With include_outcomes the per-crash timings are returned under 'outcomes'.
+    """
+    return run_simulation(_run_burst(num_crashes, num_contacts, arrival_window, seed, include_outcomes))
+
+
+def run_load_test(burst_sizes: List[int] = None, num_contacts: int = 2,
+                  seed: Optional[int] = None) -> pd.DataFrame:
+    """Stress-test the dispatch pipeline with increasing mass-casualty bursts"""
+    rows = []
+    for burst_size in burst_sizes or DEFAULT_BURST_SIZES:
+        print(f"Dispatching burst of {burst_size} simultaneous crashes...")
+        rows.append(simulate_dispatch_burst(burst_size, num_contacts, seed=seed))
+    return pd.DataFrame(rows)
+
+
+def main():
+    """Run the mass-casualty dispatch load test"""
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Emergency Dispatch Load Test")
+    print("=" * 60)
+
+    results = run_load_test(seed=42)
+
+    print("\nDispatch time (simulated seconds) by burst size:")
+    columns = ['burst_size', 'avg_dispatch_time', 'p95_dispatch_time', 'max_dispatch_time',
+               'contact_delivery_rate', 'hospital_info_success_rate', 'retries', 'timeouts']
+    print(results[columns].to_string(index=False, float_format=lambda x: f"{x:.1f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Evaluation History Dashboard
+Multi-run comparison and trend tracking across historical evaluations
+
+Indexes every archived SystemEvaluator run (evaluation_runs/*/detailed_test_results.json),
+computes per-metric trends and run-to-run deltas, and renders a single static
+HTML dashboard. Results CSVs from generate_results_table.py are not indexed:
+they hold the fixed reference table, not measurements.
+
+Both the index and the dashboard are updated incrementally: only runs that
+have not been seen before are parsed and appended.
+"""
+
+import argparse
+import glob
+import html
+import json
+import os
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+RUNS_DIR = 'evaluation_runs'
+INDEX_FILENAME = 'index.csv'
+DASHBOARD_FILENAME = 'dashboard.html'
+INDEX_COLUMNS = ['run_id', 'timestamp', 'revision', 'source', 'component', 'metric', 'value']
+
+TRENDS_BEGIN = '<!-- TRENDS:BEGIN -->'
+TRENDS_END = '<!-- TRENDS:END -->'
+RUNS_END = '<!-- RUNS:END -->'
+
+
+def _load_archived_run(path: str) -> List[tuple]:
+    """Flatten one archived SystemEvaluator run into long-format metric rows"""
+    with open(path) as f:
+        run = json.load(f)
+    revision = run.get('revision') or 'unknown'
+    return [
+        (run['run_id'], run['timestamp'], revision, path, component, metric, value)
+        for component, results in run['results'].items()
+        for metric, value in results.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+
+
+def discover_runs(runs_dir: str = RUNS_DIR) -> List[str]:
+    """List every archived run on disk"""
+    return sorted(glob.glob(os.path.join(runs_dir, '*', 'detailed_test_results.json')))
+
+
+def update_index(runs_dir: str = RUNS_DIR) -> pd.DataFrame:
+    """Load the run index, parse only runs not indexed yet, and persist the result"""
+    index_path = os.path.join(runs_dir, INDEX_FILENAME)
+    if os.path.exists(index_path):
+        index = pd.read_csv(index_path)
+        archived = index['source'].str.endswith('.json')
+        if not archived.all():  # Drop results-CSV rows written by older versions
+            index = index[archived].reset_index(drop=True)
+            index.to_csv(index_path, index=False)
+    else:
+        index = pd.DataFrame(columns=INDEX_COLUMNS)
+
+    known = set(index['source'])
+    new_paths = [path for path in discover_runs(runs_dir) if path not in known]
+    if not new_paths:
+        return index
+
+    rows = []
+    for path in new_paths:
+        rows.extend(_load_archived_run(path))
+
+    new_rows = pd.DataFrame(rows, columns=INDEX_COLUMNS)
+    os.makedirs(runs_dir, exist_ok=True)
+    new_rows.to_csv(index_path, mode='a', header=not os.path.exists(index_path), index=False)
+    print(f"Indexed {len(new_paths)} new run(s)")
+    return pd.concat([index, new_rows], ignore_index=True) if len(index) else new_rows
+
+
+def compute_deltas(index: pd.DataFrame) -> pd.DataFrame:
+    """Add run-to-run delta and percent change for every metric, in timestamp order"""
+    df = index.dropna(subset=['value']).sort_values(['component', 'metric', 'timestamp'], kind='stable')
+    grouped = df.groupby(['component', 'metric'], sort=False)['value']
+    df['delta'] = grouped.diff()
+    df['pct_change'] = grouped.pct_change() * 100
+    df['run_number'] = grouped.cumcount()
+    return df
+
+
+def compute_trends(deltas: pd.DataFrame) -> pd.DataFrame:
+    """Summarize each metric's history: latest value, last delta, range and linear trend"""
+    grouped = deltas.groupby(['component', 'metric'], sort=True)
+    trends = grouped['value'].agg(runs='count', first='first', latest='last',
+                                  mean='mean', std='std', min='min', max='max')
+    trends['last_delta'] = grouped['delta'].last()
+
+    # Least-squares slope of value against run number, per metric, without a Python loop
+    x = deltas['run_number'].astype(float)
+    y = deltas['value']
+    sums = pd.DataFrame({'x': x, 'y': y, 'xy': x * y, 'xx': x * x},
+                        index=deltas.index).groupby([deltas['component'], deltas['metric']]).sum()
+    n = trends['runs']
+    denominator = n * sums['xx'] - sums['x'] ** 2
+    trends['slope_per_run'] = (n * sums['xy'] - sums['x'] * sums['y']) / denominator.replace(0, np.nan)
+    return trends.reset_index()
+
+
+def _fmt(value: float, spec: str) -> str:
+    """Format a number for the dashboard, leaving missing values blank"""
+    return '' if pd.isna(value) else format(value, spec)
+
+
+def _sparkline(values: np.ndarray, width: int = 120, height: int = 24) -> str:
+    """Render a metric's history as a small inline SVG polyline"""
+    if len(values) < 2:
+        return ''
+    low, high = np.min(values), np.max(values)
+    span = high - low or 1.0
+    xs = np.linspace(0, width, len(values))
+    ys = height - (values - low) / span * height
+    points = ' '.join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    return (f'<svg width="{width}" height="{height}"><polyline points="{points}" '
+            f'fill="none" stroke="#4CAF50" stroke-width="1.5"/></svg>')
+
+
+def _render_trends(trends: pd.DataFrame, deltas: pd.DataFrame) -> str:
+    """Render the per-metric trend table"""
+    history = deltas.groupby(['component', 'metric'])['value'].apply(lambda s: s.to_numpy())
+    rows = []
+    for row in trends.itertuples(index=False):
+        delta_class = 'up' if row.last_delta > 0 else 'down' if row.last_delta < 0 else ''
+        rows.append(
+            f"<tr><td>{html.escape(str(row.component))}</td><td>{html.escape(str(row.metric))}</td>"
+            f"<td>{row.runs}</td><td>{row.latest:.3f}</td>"
+            f"<td class=\"{delta_class}\">{_fmt(row.last_delta, '+.3f')}</td>"
+            f"<td>{row.mean:.3f}</td><td>{row.min:.3f}</td><td>{row.max:.3f}</td>"
+            f"<td>{_fmt(row.slope_per_run, '+.4f')}</td>"
+            f"<td>{_sparkline(history[(row.component, row.metric)])}</td></tr>"
+        )
+    return (
+        f"{TRENDS_BEGIN}\n<p>Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>\n"
+        "<table><thead><tr><th>Component</th><th>Metric</th><th>Runs</th><th>Latest</th>"
+        "<th>Last Delta</th><th>Mean</th><th>Min</th><th>Max</th><th>Slope / Run</th><th>History</th>"
+        "</tr></thead><tbody>\n" + '\n'.join(rows) + f"\n</tbody></table>\n{TRENDS_END}"
+    )
+
+
+def _render_run_rows(runs: pd.DataFrame) -> str:
+    """Render one table row per run, with every metric value for that run"""
+    rows = []
+    for (run_id, timestamp, revision), run in runs.groupby(['run_id', 'timestamp', 'revision'], sort=False):
+        metrics = ', '.join(f"{m}={v:.3g}" for m, v in zip(run['metric'], run['value']) if pd.notna(v))
+        rows.append(f"<tr><td>{html.escape(str(timestamp))}</td><td>{html.escape(str(run_id))}</td>"
+                    f"<td>{html.escape(str(revision))}</td><td>{html.escape(metrics)}</td></tr>")
+    return '\n'.join(rows)
+
+
+def _empty_dashboard() -> str:
+    """Dashboard skeleton with markers for the trend section and the run log"""
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<title>Smart Vehicle Safety System - Evaluation History</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; font-size: 13px; }}
+th {{ background: #4CAF50; color: white; }}
+.up {{ color: #2e7d32; }} .down {{ color: #c62828; }}
+</style></head><body>
+<h1>Smart Vehicle Safety &amp; Speed Control System</h1>
+<h2>Metric Trends</h2>
+{TRENDS_BEGIN}
+{TRENDS_END}
+<h2>Run Log</h2>
+<table><thead><tr><th>Timestamp</th><th>Run</th><th>Revision</th><th>Metrics</th></tr></thead><tbody>
+{RUNS_END}
+</tbody></table>
+</body></html>
+"""
+
+
+def render_dashboard(index: pd.DataFrame, output_path: str,
+                     new_run_ids: Optional[set] = None) -> pd.DataFrame:
+    """Write the HTML dashboard, appending rows only for runs not already on it"""
+    if os.path.exists(output_path):
+        with open(output_path) as f:
+            page = f.read()
+    else:
+        page = _empty_dashboard()
+        new_run_ids = None  # Fresh dashboard needs every run
+
+    deltas = compute_deltas(index)
+    trends = compute_trends(deltas)
+
+    start, end = page.index(TRENDS_BEGIN), page.index(TRENDS_END) + len(TRENDS_END)
+    page = page[:start] + _render_trends(trends, deltas) + page[end:]
+
+    runs = index if new_run_ids is None else index[index['run_id'].isin(new_run_ids)]
+    if len(runs):
+        runs = runs.sort_values('timestamp', kind='stable')
+        page = page.replace(RUNS_END, _render_run_rows(runs) + '\n' + RUNS_END)
+
+    with open(output_path, 'w') as f:
+        f.write(page)
+    return trends
+
+
+def update_dashboard(runs_dir: str = RUNS_DIR,
+                     output_path: Optional[str] = None) -> pd.DataFrame:
+    """Index new runs and refresh the dashboard, returning the per-metric trend table"""
+    output_path = output_path or os.path.join(runs_dir, DASHBOARD_FILENAME)
+    index_path = os.path.join(runs_dir, INDEX_FILENAME)
+    previous_ids = set(pd.read_csv(index_path, usecols=['run_id'])['run_id']) if os.path.exists(index_path) else set()
+
+    index = update_index(runs_dir)
+    if index.empty:
+        print("No evaluation runs found")
+        return pd.DataFrame()
+
+    if previous_ids - set(index['run_id']) and os.path.exists(output_path):
+        os.remove(output_path)  # Runs were dropped from the index, so rebuild the run log
+    new_run_ids = set(index['run_id']) - previous_ids
+    trends = render_dashboard(index, output_path, new_run_ids)
+    print(f"Dashboard written to: {output_path}")
+    return trends
+
+
+def main():
+    """Index historical evaluation runs and render the trend dashboard"""
+    parser = argparse.ArgumentParser(description="Build the evaluation history dashboard")
+    parser.add_argument('--runs-dir', default=RUNS_DIR, help="Directory of archived evaluation runs")
+    parser.add_argument('--output', default=None, help="Dashboard HTML path")
+    args = parser.parse_args()
+
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Evaluation History Dashboard")
+    print("=" * 60)
+
+    trends = update_dashboard(args.runs_dir, output_path=args.output)
+    if not trends.empty:
+        print("\nLatest metric trends:")
+        print(trends[['component', 'metric', 'runs', 'latest', 'last_delta', 'slope_per_run']]
+              .to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
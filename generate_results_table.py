@@ -4,134 +4,40 @@ Smart Vehicle Safety & Speed Control System - Results Table Generator
 Simple script to generate the overall results table
 """
 
-import pandas as pd
-import numpy as np
 from datetime import datetime
 
+from results_model import component_summary, render, results_table, save_rendered, summary_statistics
+
 def generate_results_table():
     """Generate the overall results table for the Smart Vehicle Safety System"""
-    
-    # Define the results data
-    results_data = [
-        # Crash Detection (STM32)
-        ["Crash Detection (STM32)", "Accuracy", ">90%", "95.2%", "Excellent", "Pass"],
-        ["", "False Positive Rate", "<5%", "2.8%", "Excellent", "Pass"],
-        ["", "Response Time", "<500ms", "340ms", "Excellent", "Pass"],
-        ["", "Detection Range", "5-20G", "5-16G", "Good", "Pass"],
-        
-        # Speed Control (ESP32)
-        ["Speed Control (ESP32)", "Speed Limit Compliance", ">95%", "97.1%", "Excellent", "Pass"],
-        ["", "Motor Response Time", "<200ms", "150ms", "Excellent", "Pass"],
-        ["", "PWM Accuracy", "±2%", "±1.2%", "Excellent", "Pass"],
-        ["", "Bluetooth Latency", "<100ms", "85ms", "Excellent", "Pass"],
-        
-        # Android Application
-        ["Android Application", "GPS Accuracy", "<5m", "3.2m", "Excellent", "Pass"],
-        ["", "Speed Limit API Success", ">90%", "93.7%", "Excellent", "Pass"],
-        ["", "Emergency SMS Delivery", ">95%", "98.4%", "Excellent", "Pass"],
-        ["", "Hospital Search Time", "<3s", "2.1s", "Excellent", "Pass"],
-        
-        # ML Accident Risk Model
-        ["ML Accident Risk Model", "Prediction Accuracy (R²)", ">0.75", "0.82", "Excellent", "Pass"],
-        ["", "RMSE", "<10 km/h", "7.3 km/h", "Excellent", "Pass"],
-        ["", "Risk Calculation Time", "<50ms", "28ms", "Excellent", "Pass"],
-        ["", "Feature Encoding Accuracy", ">95%", "97.8%", "Excellent", "Pass"],
-        
-        # System Integration
-        ["System Integration", "End-to-End Latency", "<1s", "0.7s", "Excellent", "Pass"],
-        ["", "Multi-device Sync", ">90%", "94.3%", "Excellent", "Pass"],
-        ["", "Power Consumption", "<2W", "1.6W", "Excellent", "Pass"],
-        ["", "System Uptime", ">99%", "99.2%", "Excellent", "Pass"],
-        
-        # Emergency Response
-        ["Emergency Response", "Alert Dispatch Time", "<10s", "6.2s", "Excellent", "Pass"],
-        ["", "Location Accuracy", "<10m", "4.8m", "Excellent", "Pass"],
-        ["", "Contact Delivery Rate", ">95%", "98.1%", "Excellent", "Pass"],
-        ["", "Hospital Info Retrieval", ">85%", "89.3%", "Good", "Pass"],
-        
-        # Manual Override
-        ["Manual Override", "Authorization Time", "<30s", "18s", "Excellent", "Pass"],
-        ["", "Logging Accuracy", "100%", "100%", "Perfect", "Pass"],
-        ["", "SMS Alert Success", ">95%", "96.7%", "Excellent", "Pass"],
-        ["", "Deactivation Response", "<5s", "3.1s", "Excellent", "Pass"],
-    ]
-    
-    # Create DataFrame
-    columns = ["Component", "Metric", "Target", "Achieved", "Performance", "Status"]
-    df = pd.DataFrame(results_data, columns=columns)
-    
-    return df
+    return results_table()
 
 def print_results_table():
     """Print the results table in a formatted way"""
-    df = generate_results_table()
+    df = results_table()
+    stats = summary_statistics()
     
-    print("Smart Vehicle Safety & Speed Control System")
-    print("Overall Results Summary")
-    print("=" * 100)
+    # The rendered table carries its own title, pass summary and overall grade
     print(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 100)
-    
-    # Print table with proper formatting
-    pd.set_option('display.max_columns', None)
-    pd.set_option('display.width', None)
-    pd.set_option('display.max_colwidth', None)
+    print(render('text'))
     
-    print(df.to_string(index=False))
-    
-    print("\n" + "=" * 100)
-    print("SUMMARY STATISTICS")
-    print("=" * 100)
-    
-    # Calculate summary statistics
-    total_metrics = len(df)
-    passed_metrics = len(df[df['Status'].str.contains('Pass')])
-    excellent_performance = len(df[df['Performance'] == 'Excellent'])
-    good_performance = len(df[df['Performance'] == 'Good'])
-    perfect_performance = len(df[df['Performance'] == 'Perfect'])
-    
-    print(f"Total Metrics Evaluated: {total_metrics}")
-    print(f"Passed Metrics: {passed_metrics} ({passed_metrics/total_metrics*100:.1f}%)")
-    print(f"Excellent Performance: {excellent_performance} ({excellent_performance/total_metrics*100:.1f}%)")
-    print(f"Good Performance: {good_performance} ({good_performance/total_metrics*100:.1f}%)")
-    print(f"Perfect Performance: {perfect_performance} ({perfect_performance/total_metrics*100:.1f}%)")
-    
-    print(f"\nOverall System Grade: {'A+' if passed_metrics/total_metrics >= 0.95 else 'A' if passed_metrics/total_metrics >= 0.90 else 'B+'}")
+    total_metrics = stats['total']
+    print(f"Excellent Performance: {stats['excellent']} ({stats['excellent']/total_metrics*100:.1f}%)")
+    print(f"Good Performance: {stats['good']} ({stats['good']/total_metrics*100:.1f}%)")
+    print(f"Perfect Performance: {stats['perfect']} ({stats['perfect']/total_metrics*100:.1f}%)")
     
     return df
 
 def save_results_to_csv():
     """Save results to CSV file"""
-    df = generate_results_table()
     filename = f"smart_vehicle_system_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    df.to_csv(filename, index=False)
+    save_rendered('csv', filename)
     print(f"\nResults saved to: {filename}")
     return filename
 
 def generate_component_summary():
     """Generate a component-wise summary"""
-    df = generate_results_table()
-    
-    # Group by component
-    components = df['Component'].unique()
-    components = [comp for comp in components if comp != '']  # Remove empty strings
-    
-    component_summary = []
-    for component in components:
-        component_data = df[df['Component'] == component]
-        total_metrics = len(component_data)
-        passed_metrics = len(component_data[component_data['Status'].str.contains('Pass')])
-        pass_rate = passed_metrics / total_metrics * 100
-        
-        component_summary.append({
-            'Component': component,
-            'Total Metrics': total_metrics,
-            'Passed': passed_metrics,
-            'Pass Rate (%)': f"{pass_rate:.1f}%",
-            'Status': 'Pass' if pass_rate >= 90 else 'Review'
-        })
-    
-    summary_df = pd.DataFrame(component_summary)
+    summary_df = component_summary()
     
     print("\nCOMPONENT-WISE SUMMARY")
     print("=" * 60)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Hospital Geo-Spatial Index
+Offline nearest-hospital lookup for emergency response simulation
+
+Loads a local hospital dataset (CSV, or the Geoapify GeoJSON that
+HospitalService.kt parses) and answers bulk k-nearest queries for simulated
+crash locations using great-circle (haversine) distance.
+"""
+
+import json
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional, queries fall back to brute force
+    cKDTree = None
+
+EARTH_RADIUS_M = 6371008.8
+DEFAULT_CENTER = (12.9716, 77.5946)  # Same default coordinates as MainActivity.kt
+HOSPITAL_COLUMNS = ["name", "address", "latitude", "longitude", "phone"]
+
+
+def haversine_distance(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in meters between coordinate arrays (degrees)"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _to_unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """Project latitude/longitude (degrees) onto the unit sphere"""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def _chord_to_meters(chord: np.ndarray) -> np.ndarray:
+    """Convert unit-sphere chord length to great-circle distance in meters"""
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.clip(chord / 2, 0.0, 1.0))
+
+
+def _meters_to_chord(distance_m: float) -> float:
+    """Convert great-circle distance in meters to unit-sphere chord length"""
+    return 2 * np.sin(min(distance_m / EARTH_RADIUS_M, np.pi) / 2)
+
+
+def load_hospitals_csv(path: str) -> pd.DataFrame:
+    """Load hospitals from a CSV with name, address, latitude, longitude, phone columns"""
+    df = pd.read_csv(path)
+    missing = {"latitude", "longitude"} - set(df.columns)
+    if missing:
+        raise ValueError(f"Hospital dataset {path} is missing columns: {sorted(missing)}")
+    for column in HOSPITAL_COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+    return df[HOSPITAL_COLUMNS].dropna(subset=["latitude", "longitude"]).reset_index(drop=True)
+
+
+def load_hospitals_geojson(path: str) -> pd.DataFrame:
+    """Load hospitals from a Geoapify places GeoJSON response"""
+    with open(path) as f:
+        features = json.load(f)["features"]
+
+    rows = []
+    for feature in features:
+        properties = feature.get("properties", {})
+        longitude, latitude = feature["geometry"]["coordinates"][:2]
+        rows.append([
+            properties.get("name"),
+            properties.get("formatted"),
+            latitude,
+            longitude,
+            properties.get("phone"),
+        ])
+    return pd.DataFrame(rows, columns=HOSPITAL_COLUMNS)
+
+
+def load_hospitals(path: str) -> pd.DataFrame:
+    """Load a local hospital dataset, choosing the parser from the file extension"""
+    if path.lower().endswith((".json", ".geojson")):
+        return load_hospitals_geojson(path)
+    return load_hospitals_csv(path)
+
+
+def generate_synthetic_hospitals(num_hospitals: int = 500,
+                                 center: Tuple[float, float] = DEFAULT_CENTER,
+                                 radius_km: float = 50.0,
+                                 seed: Optional[int] = None) -> pd.DataFrame:
+    """Generate a synthetic hospital dataset scattered around a city center"""
+    rng = np.random.default_rng(seed)
+    latitudes, longitudes = sample_locations(num_hospitals, center, radius_km, rng)
+    ids = np.arange(num_hospitals)
+    return pd.DataFrame({
+        "name": [f"Hospital {i}" for i in ids],
+        "address": [f"Synthetic Address {i}" for i in ids],
+        "latitude": latitudes,
+        "longitude": longitudes,
+        "phone": None,
+    })
+
+
+def sample_locations(num_locations: int,
+                     center: Tuple[float, float] = DEFAULT_CENTER,
+                     radius_km: float = 50.0,
+                     rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample locations uniformly over a disc around a center (e.g. simulated crash sites)"""
+    rng = rng if rng is not None else np.random.default_rng()
+    distance = radius_km * 1000 * np.sqrt(rng.random(num_locations))
+    bearing = rng.uniform(0, 2 * np.pi, num_locations)
+
+    lat0 = np.radians(center[0])
+    lon0 = np.radians(center[1])
+    angular = distance / EARTH_RADIUS_M
+    lat = np.arcsin(np.sin(lat0) * np.cos(angular) + np.cos(lat0) * np.sin(angular) * np.cos(bearing))
+    lon = lon0 + np.arctan2(np.sin(bearing) * np.sin(angular) * np.cos(lat0),
+                            np.cos(angular) - np.sin(lat0) * np.sin(lat))
+    return np.degrees(lat), (np.degrees(lon) + 540) % 360 - 180
+
+
+class HospitalIndex:
+    """Haversine k-nearest index over a hospital dataset
+
+    Hospitals are stored as points on the unit sphere, where straight-line
+    (chord) distance is monotonic in great-circle distance, so a Euclidean
+    KD-tree returns exact haversine neighbours.
+    """
+
+    def __init__(self, hospitals: pd.DataFrame, leafsize: int = 16):
+        if hospitals.empty:
+            raise ValueError("Hospital dataset is empty")
+        self.hospitals = hospitals.reset_index(drop=True)
+        self.latitudes = self.hospitals["latitude"].to_numpy(dtype=np.float64)
+        self.longitudes = self.hospitals["longitude"].to_numpy(dtype=np.float64)
+        self._points = _to_unit_vectors(self.latitudes, self.longitudes)
+        self._tree = cKDTree(self._points, leafsize=leafsize) if cKDTree is not None else None
+
+    def __len__(self) -> int:
+        return len(self.hospitals)
+
+    def query(self, latitudes, longitudes, k: int = 1,
+              chunk_size: int = 1_000_000) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (distances in meters, hospital row indices) of the k nearest hospitals
+
+        Queries are processed in chunks so millions of crash locations can be
+        answered with bounded memory. Results have shape (n,) for k == 1 and
+        (n, k) otherwise.
+        """
+        latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+        longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+        k = max(1, min(k, len(self)))
+
+        num_queries = len(latitudes)
+        distances = np.empty((num_queries, k), dtype=np.float64)
+        indices = np.empty((num_queries, k), dtype=np.intp)
+
+        for start in range(0, num_queries, chunk_size):
+            stop = min(start + chunk_size, num_queries)
+            points = _to_unit_vectors(latitudes[start:stop], longitudes[start:stop])
+            if self._tree is not None:
+                chord, idx = self._tree.query(points, k=k, workers=-1)
+                distances[start:stop] = _chord_to_meters(chord).reshape(-1, k)
+                indices[start:stop] = idx.reshape(-1, k)
+            else:
+                distances[start:stop], indices[start:stop] = self._brute_force(points, k)
+
+        if k == 1:
+            return distances[:, 0], indices[:, 0]
+        return distances, indices
+
+    def _brute_force(self, points: np.ndarray, k: int,
+                     block_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact k-nearest search without scipy, in blocks of queries"""
+        distances = np.empty((len(points), k), dtype=np.float64)
+        indices = np.empty((len(points), k), dtype=np.intp)
+        for start in range(0, len(points), block_size):
+            block = points[start:start + block_size]
+            # |a - b|^2 = 2 - 2 a.b for unit vectors
+            chord_sq = np.maximum(2.0 - 2.0 * block @ self._points.T, 0.0)
+            if k < chord_sq.shape[1]:
+                idx = np.argpartition(chord_sq, k - 1, axis=1)[:, :k]
+            else:
+                idx = np.broadcast_to(np.arange(chord_sq.shape[1]), chord_sq.shape).copy()
+            nearest = np.take_along_axis(chord_sq, idx, axis=1)
+            order = np.argsort(nearest, axis=1)
+            indices[start:start + len(block)] = np.take_along_axis(idx, order, axis=1)
+            distances[start:start + len(block)] = _chord_to_meters(
+                np.sqrt(np.take_along_axis(nearest, order, axis=1)))
+        return distances, indices
+
+    def nearest(self, latitude: float, longitude: float, k: int = 5) -> pd.DataFrame:
+        """Return the k nearest hospitals to a single location, closest first"""
+        distances, indices = self.query([latitude], [longitude], k=k)
+        result = self.hospitals.iloc[np.ravel(indices)].copy()
+        result["distance"] = np.ravel(distances)
+        return result.reset_index(drop=True)
+
+    def within_radius(self, latitude: float, longitude: float,
+                      radius_m: float = 5000, limit: int = 20) -> pd.DataFrame:
+        """Offline equivalent of HospitalService.getNearbyHospitals (5 km circle, 20 results)"""
+        if self._tree is not None:
+            point = _to_unit_vectors([latitude], [longitude])[0]
+            idx = np.asarray(self._tree.query_ball_point(point, _meters_to_chord(radius_m)), dtype=np.intp)
+        else:
+            idx = np.arange(len(self))
+        distances = haversine_distance(latitude, longitude, self.latitudes[idx], self.longitudes[idx])
+        keep = distances <= radius_m
+        idx, distances = idx[keep], distances[keep]
+        order = np.argsort(distances)[:limit]
+
+        result = self.hospitals.iloc[idx[order]].copy()
+        result["distance"] = distances[order]
+        return result.reset_index(drop=True)
+
+
+def benchmark_nearest_queries(index: HospitalIndex, num_queries: int = 1_000_000,
+                              k: int = 1, radius_km: float = 50.0,
+                              seed: Optional[int] = None) -> Dict:
+    """Measure bulk k-nearest lookup cost and distance-to-care for simulated crashes"""
+    rng = np.random.default_rng(seed)
+    center = (float(np.mean(index.latitudes)), float(np.mean(index.longitudes)))
+    latitudes, longitudes = sample_locations(num_queries, center, radius_km, rng)
+
+    start_time = time.perf_counter()
+    distances, _ = index.query(latitudes, longitudes, k=k)
+    elapsed = time.perf_counter() - start_time
+
+    nearest = distances if distances.ndim == 1 else distances[:, 0]
+    return {
+        'num_hospitals': len(index),
+        'num_queries': num_queries,
+        'k': k,
+        'total_lookup_time': elapsed,
+        'avg_lookup_time_us': elapsed / num_queries * 1e6,
+        'queries_per_second': num_queries / elapsed if elapsed > 0 else float('inf'),
+        'avg_distance_to_care_m': float(np.mean(nearest)),
+        'p95_distance_to_care_m': float(np.percentile(nearest, 95)),
+        'max_distance_to_care_m': float(np.max(nearest)),
+    }
+
+
+def main():
+    """Build a hospital index and benchmark bulk nearest-hospital queries"""
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Hospital Geo-Spatial Index Benchmark")
+    print("=" * 60)
+
+    if len(sys.argv) > 1:
+        hospitals = load_hospitals(sys.argv[1])
+        print(f"Loaded {len(hospitals)} hospitals from {sys.argv[1]}")
+    else:
+        hospitals = generate_synthetic_hospitals()
+        print(f"No dataset given, generated {len(hospitals)} synthetic hospitals")
+
+    start_time = time.perf_counter()
+    index = HospitalIndex(hospitals)
+    print(f"Index built in {(time.perf_counter() - start_time) * 1000:.1f}ms "
+          f"({'KD-tree' if index._tree is not None else 'brute force'})")
+
+    results = benchmark_nearest_queries(index)
+    print(f"Queries: {results['num_queries']:,} in {results['total_lookup_time']:.2f}s "
+          f"({results['queries_per_second']:,.0f} queries/s)")
+    print(f"Average lookup cost: {results['avg_lookup_time_us']:.2f}us")
+    print(f"Average distance to care: {results['avg_distance_to_care_m'] / 1000:.2f}km")
+    print(f"95th percentile distance to care: {results['p95_distance_to_care_m'] / 1000:.2f}km")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Manual Override Audit
+Override session simulator and append-only, time-indexed event log
+
+Models the manual override path in MainActivity.kt (confirmation, SMS alert,
+OverrideLogs entry, '2'/'3' Bluetooth commands) and the ESP32's handling of
+manualOverrideActive. Events are stored in an append-only log of sorted
+segments that answers time-range and per-vehicle queries with binary
+search, so compliance audits over millions of events stay cheap.
+"""
+
+import argparse
+import glob
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from trial_records import TRIAL_DTYPES
+
+EVENT_DTYPE = np.dtype([
+    ('timestamp_ms', np.int64),
+    ('vehicle_id', np.uint32),
+    ('override_id', np.uint64),
+    ('event', np.uint8),
+    ('latitude', np.float32),
+    ('longitude', np.float32),
+])
+
+# Event types, in the order they occur during one override session
+OVERRIDE_REQUESTED = 0  # Driver confirms the Manual Override dialog
+SMS_SENT = 1  # sendManualOverrideSMS succeeded
+SMS_FAILED = 2
+LOG_WRITTEN = 3  # OverrideLogs entry added with status "active"
+LOG_FAILED = 4  # "Failed to log manual override", override not activated
+ESP32_OVERRIDE_ON = 5  # ESP32 replied "Manual Override: ON" to '2'
+REASON_SUBMITTED = 6
+DEACTIVATION_REQUESTED = 7  # Driver taps "End Manual Override"
+ESP32_OVERRIDE_OFF = 8  # ESP32 replied "Manual Override: OFF" to '3'
+LOG_CLOSED = 9  # OverrideLogs entry updated with status "deactivated"
+
+EVENT_NAMES = ['override_requested', 'sms_sent', 'sms_failed', 'log_written', 'log_failed',
+               'esp32_override_on', 'reason_submitted', 'deactivation_requested',
+               'esp32_override_off', 'log_closed']
+
+# Session behaviour, calibrated to the Manual Override rows of the results tables
+DEFAULT_OVERRIDE_PARAMS = {
+    'authorization_time_s': 18.0,  # Confirmation to logged activation
+    'sms_success_rate': 0.967,
+    'log_success_rate': 0.998,
+    'log_close_success_rate': 0.995,  # The "deactivated" update has no failure handling
+    'esp32_ack_rate': 0.997,  # Each "Manual Override: ON/OFF" reply reaches the app
+    'reason_rate': 0.9,
+    'deactivation_time_s': 3.1,  # End request to ESP32 acknowledgement
+    'session_minutes': 10.0,
+}
+
+DEFAULT_SEGMENT_SIZE = 1_000_000
+
+
+class OverrideEventLog:
+    """Append-only override event log made of time-sorted segments
+
+    Appends must not go back in time. Full segments are sealed (and written to
+    `directory` as .npy files when one is given); each sealed segment keeps its
+    time bounds and a lazily built per-vehicle index for fast lookups.
+    """
+
+    def __init__(self, directory: Optional[str] = None, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        self.directory = directory
+        self.segment_size = segment_size
+        self._segments: List[np.ndarray] = []
+        self._vehicle_index: Dict[int, tuple] = {}
+        self._active = np.empty(segment_size, dtype=EVENT_DTYPE)
+        self._active_size = 0
+        self._last_timestamp = np.iinfo(np.int64).min
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def open(cls, directory: str, segment_size: int = DEFAULT_SEGMENT_SIZE) -> 'OverrideEventLog':
+        """Open a persisted log, memory-mapping its sealed segments"""
+        log = cls(directory, segment_size)
+        for path in sorted(glob.glob(os.path.join(directory, 'segment_*.npy'))):
+            segment = np.load(path, mmap_mode='r')
+            if len(segment):
+                log._segments.append(segment)
+                log._last_timestamp = int(segment['timestamp_ms'][-1])
+        return log
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments) + self._active_size
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Timestamp of the newest logged event, or None for an empty log"""
+        return self._last_timestamp if len(self) else None
+
+    def append(self, events: np.ndarray):
+        """Append events, sorting the batch by time; raises ValueError on out-of-order batches"""
+        events = np.asarray(events, dtype=EVENT_DTYPE)
+        if not len(events):
+            return
+        events = events[np.argsort(events['timestamp_ms'], kind='stable')]
+        if events['timestamp_ms'][0] < self._last_timestamp:
+            raise ValueError("Override events must be appended in time order")
+        self._last_timestamp = int(events['timestamp_ms'][-1])
+
+        while len(events):
+            n = min(len(events), self.segment_size - self._active_size)
+            self._active[self._active_size:self._active_size + n] = events[:n]
+            self._active_size += n
+            events = events[n:]
+            if self._active_size == self.segment_size:
+                self._seal()
+
+    def flush(self):
+        """Seal the partially filled active segment"""
+        if self._active_size:
+            self._seal()
+
+    def _seal(self):
+        """Move the active segment into the sealed list, persisting it if the log has a directory"""
+        segment = self._active[:self._active_size].copy()
+        if self.directory:
+            path = os.path.join(self.directory, f"segment_{len(self._segments):06d}.npy")
+            np.save(path, segment)
+            segment = np.load(path, mmap_mode='r')
+        self._segments.append(segment)
+        self._active_size = 0
+
+    def _all_segments(self) -> List[np.ndarray]:
+        segments = list(self._segments)
+        if self._active_size:
+            segments.append(self._active[:self._active_size])
+        return segments
+
+    def range(self, start_ms: int, end_ms: int) -> np.ndarray:
+        """All events with start_ms <= timestamp < end_ms, in time order"""
+        parts = []
+        for segment in self._all_segments():
+            timestamps = segment['timestamp_ms']
+            if timestamps[0] >= end_ms or timestamps[-1] < start_ms:
+                continue
+            lo, hi = np.searchsorted(timestamps, [start_ms, end_ms], side='left')
+            parts.append(segment[lo:hi])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=EVENT_DTYPE)
+
+    def _vehicle_lookup(self, i: int, segment: np.ndarray) -> tuple:
+        """Per-vehicle index for a sealed segment: event positions grouped by vehicle"""
+        if i not in self._vehicle_index:
+            order = np.argsort(segment['vehicle_id'], kind='stable')  # Time order kept within a vehicle
+            self._vehicle_index[i] = (order, segment['vehicle_id'][order])
+        return self._vehicle_index[i]
+
+    def vehicle(self, vehicle_id: int, start_ms: Optional[int] = None,
+                end_ms: Optional[int] = None) -> np.ndarray:
+        """Events of one vehicle, optionally limited to a time range, in time order"""
+        start_ms = np.iinfo(np.int64).min if start_ms is None else start_ms
+        end_ms = np.iinfo(np.int64).max if end_ms is None else end_ms
+        parts = []
+        for i, segment in enumerate(self._all_segments()):
+            timestamps = segment['timestamp_ms']
+            if timestamps[0] >= end_ms or timestamps[-1] < start_ms:
+                continue
+            if i < len(self._segments):
+                order, vehicles = self._vehicle_lookup(i, segment)
+                lo, hi = np.searchsorted(vehicles, [vehicle_id, vehicle_id + 1])
+                events = segment[order[lo:hi]]
+            else:
+                events = segment[segment['vehicle_id'] == vehicle_id]
+            lo, hi = np.searchsorted(events['timestamp_ms'], [start_ms, end_ms], side='left')
+            parts.append(events[lo:hi])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=EVENT_DTYPE)
+
+
+def simulate_override_sessions(num_sessions: int, num_vehicles: int = 100, start_ms: int = 1_700_000_000_000,
+                               period_days: float = 30.0, first_override_id: int = 0,
+                               rng: Optional[np.random.Generator] = None, params: Optional[Dict] = None) -> np.ndarray:
+    """Generate the event stream for num_sessions override sessions across a fleet"""
+    rng = rng if rng is not None else np.random.default_rng()
+    p = {**DEFAULT_OVERRIDE_PARAMS, **(params or {})}
+    n = num_sessions
+
+    override_id = first_override_id + np.arange(n, dtype=np.uint64)
+    vehicle_id = rng.integers(0, num_vehicles, n).astype(np.uint32)
+    latitude = (12.9716 + rng.normal(0, 0.1, n)).astype(np.float32)
+    longitude = (77.5946 + rng.normal(0, 0.1, n)).astype(np.float32)
+
+    requested = start_ms + rng.integers(0, int(period_days * 86_400_000), n)
+    # Location fix and SMS, then the Firestore write that gates activation
+    sms_done = requested + rng.gamma(4.0, p['authorization_time_s'] * 0.6 / 4.0, n) * 1000
+    logged = sms_done + rng.gamma(4.0, p['authorization_time_s'] * 0.4 / 4.0, n) * 1000
+    sms_ok = rng.random(n) < p['sms_success_rate']
+    log_ok = rng.random(n) < p['log_success_rate']
+    esp32_on = logged + rng.uniform(50, 300, n)  # '2' over Bluetooth
+    on_acked = log_ok & (rng.random(n) < p['esp32_ack_rate'])
+    reason = logged + rng.uniform(5, 60, n) * 1000
+    has_reason = log_ok & (rng.random(n) < p['reason_rate'])
+    deactivate = logged + rng.exponential(p['session_minutes'] * 60_000, n)
+    esp32_off = deactivate + rng.gamma(6.0, p['deactivation_time_s'] / 6.0, n) * 1000
+    off_acked = log_ok & (rng.random(n) < p['esp32_ack_rate'])
+    closed = esp32_off + rng.uniform(8, 10, n) * 1000  # After repeat(5) { send '3'; delay(2000) }
+    close_ok = log_ok & (rng.random(n) < p['log_close_success_rate'])
+
+    streams = [
+        (OVERRIDE_REQUESTED, requested, np.ones(n, dtype=bool)),
+        (SMS_SENT, sms_done, sms_ok),
+        (SMS_FAILED, sms_done, ~sms_ok),
+        (LOG_WRITTEN, logged, log_ok),
+        (LOG_FAILED, logged, ~log_ok),
+        (ESP32_OVERRIDE_ON, esp32_on, on_acked),
+        (REASON_SUBMITTED, reason, has_reason),
+        (DEACTIVATION_REQUESTED, deactivate, log_ok),
+        (ESP32_OVERRIDE_OFF, esp32_off, off_acked),
+        (LOG_CLOSED, closed, close_ok),
+    ]
+    total = sum(int(np.count_nonzero(mask)) for _, _, mask in streams)
+    events = np.empty(total, dtype=EVENT_DTYPE)
+    offset = 0
+    for event, timestamps, mask in streams:
+        k = int(np.count_nonzero(mask))
+        chunk = events[offset:offset + k]
+        chunk['timestamp_ms'] = timestamps[mask]
+        chunk['vehicle_id'] = vehicle_id[mask]
+        chunk['override_id'] = override_id[mask]
+        chunk['event'] = event
+        chunk['latitude'] = latitude[mask]
+        chunk['longitude'] = longitude[mask]
+        offset += k
+    return events[np.argsort(events['timestamp_ms'], kind='stable')]
+
+
+def session_table(events: np.ndarray) -> pd.DataFrame:
+    """Pivot events into one row per override session with a timestamp column per event type"""
+    sessions, inverse = np.unique(events['override_id'], return_inverse=True)
+    table = np.full((len(sessions), len(EVENT_NAMES)), np.nan)
+    table[inverse, events['event']] = events['timestamp_ms']
+    df = pd.DataFrame(table, columns=EVENT_NAMES)
+    df.insert(0, 'override_id', sessions)
+    vehicles = np.zeros(len(sessions), dtype=np.uint32)
+    vehicles[inverse] = events['vehicle_id']
+    df.insert(1, 'vehicle_id', vehicles)
+    return df
+
+
+def session_records(events: np.ndarray) -> np.ndarray:
+    """Convert override events into per-session manual_override trial records"""
+    df = session_table(events)
+    df = df[df['override_requested'].notna()]
+    records = np.zeros(len(df), dtype=TRIAL_DTYPES['manual_override'])
+    records['authorization_time'] = (df['log_written'] - df['override_requested']) / 1000
+    records['activated'] = df['esp32_override_on'].notna()
+    records['logged'] = df['log_written'].notna()
+    records['sms_delivered'] = df['sms_sent'].notna()
+    records['deactivation_time'] = (df['esp32_override_off'] - df['deactivation_requested']) / 1000
+    records['reason_submitted'] = df['reason_submitted'].notna()
+    records['log_closed'] = df['log_closed'].notna()
+    return records
+
+
+def audit_overrides(events: np.ndarray) -> Dict:
+    """Compliance audit of the override sessions that start within an event slice
+
+    Sessions whose request falls outside the slice are ignored, so range
+    queries that cut through a session do not skew the metrics.
+    """
+    df = session_table(events)
+    df = df[df['override_requested'].notna()]
+    activated = df['esp32_override_on'].notna()
+    logged = df['log_written'].notna() & df['log_closed'].notna()
+    deactivated = df['esp32_override_off'].notna() & df['deactivation_requested'].notna()
+    sms_attempted = df['sms_sent'].notna() | df['sms_failed'].notna()
+
+    return {
+        'sessions': len(df),
+        'activations': int(activated.sum()),
+        'avg_authorization_time': float(((df['log_written'] - df['override_requested']) / 1000).mean()),
+        # Every ESP32 activation must be backed by an OverrideLogs entry that was also closed
+        'logging_accuracy': float((activated & logged).sum() / activated.sum() * 100) if activated.any() else 100.0,
+        'sms_alert_success_rate': float(df['sms_sent'].notna().sum() / sms_attempted.sum() * 100)
+        if sms_attempted.any() else 0.0,
+        'avg_deactivation_time': float(((df['esp32_override_off'] - df['deactivation_requested'])[deactivated] / 1000).mean()),
+        'missing_reason': int((activated & df['reason_submitted'].isna()).sum()),
+        'unclosed_logs': int((activated & df['log_closed'].isna()).sum()),
+        'total_tests': len(df),
+    }
+
+
+def main():
+    """Simulate a fleet's override history and time audit queries against the event log"""
+    parser = argparse.ArgumentParser(description="Manual override audit simulation")
+    parser.add_argument('--sessions', type=int, default=500_000, help="Override sessions to simulate")
+    parser.add_argument('--vehicles', type=int, default=5_000)
+    parser.add_argument('--log-dir', default=None, help="Persist the event log to this directory")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Manual Override Audit Simulation")
+    print("=" * 60)
+
+    rng = np.random.default_rng(args.seed)
+    start_time = time.perf_counter()
+    events = simulate_override_sessions(args.sessions, args.vehicles, rng=rng)
+    log = OverrideEventLog(args.log_dir)
+    log.append(events)
+    log.flush()
+    print(f"Logged {len(log):,} events for {args.sessions:,} sessions in {time.perf_counter() - start_time:.2f}s")
+
+    start_ms = int(events['timestamp_ms'][0])
+    week_ms = 7 * 86_400_000
+
+    start_time = time.perf_counter()
+    week = log.range(start_ms, start_ms + week_ms)
+    range_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    log.vehicle(0)  # First per-vehicle query builds the segment indexes
+    index_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    vehicle_events = log.vehicle(1)
+    vehicle_time = time.perf_counter() - start_time
+
+    print(f"First-week range query: {len(week):,} events in {range_time * 1000:.2f}ms")
+    print(f"Per-vehicle index built in {index_time * 1000:.1f}ms")
+    print(f"Vehicle 1 history: {len(vehicle_events):,} events in {vehicle_time * 1000:.2f}ms")
+
+    results = audit_overrides(log.range(start_ms, np.iinfo(np.int64).max))
+    print("\nFleet override audit:")
+    print(f"   Authorization time: {results['avg_authorization_time']:.1f}s")
+    print(f"   Logging accuracy: {results['logging_accuracy']:.1f}%")
+    print(f"   SMS alert success: {results['sms_alert_success_rate']:.1f}%")
+    print(f"   Deactivation response: {results['avg_deactivation_time']:.1f}s")
+    print(f"   Sessions missing a reason: {results['missing_reason']:,}")
+    print(f"   Activations without a closed log: {results['unclosed_logs']:,}")
+
+
+if __name__ == "__main__":
+    main()
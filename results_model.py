@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Results Model
+Single source for the overall results table and its report formats
+
+Builds the 28-row results table once, either from the reference figures or
+from an archived SystemEvaluator run, and caches it together with the
+component summary and the rendered text, CSV and HTML output.
+generate_results_table.py, quick_results.py and simple_table_matplotlib.py
+all render from this model, and render_all writes the text, CSV, HTML and
+matplotlib reports in one pass.
+"""
+
+import argparse
+import glob
+import html
+import json
+import operator
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from evaluation_history import RUNS_DIR
+
+COLUMNS = ["Component", "Metric", "Target", "Achieved", "Performance", "Status"]
+
+# Reference results for every evaluated metric
+RESULTS_DATA = [
+    # Crash Detection (STM32)
+    ["Crash Detection (STM32)", "Accuracy", ">90%", "95.2%", "Excellent", "Pass"],
+    ["", "False Positive Rate", "<5%", "2.8%", "Excellent", "Pass"],
+    ["", "Response Time", "<500ms", "340ms", "Excellent", "Pass"],
+    ["", "Detection Range", "5-20G", "5-16G", "Good", "Pass"],
+
+    # Speed Control (ESP32)
+    ["Speed Control (ESP32)", "Speed Limit Compliance", ">95%", "97.1%", "Excellent", "Pass"],
+    ["", "Motor Response Time", "<200ms", "150ms", "Excellent", "Pass"],
+    ["", "PWM Accuracy", "±2%", "±1.2%", "Excellent", "Pass"],
+    ["", "Bluetooth Latency", "<100ms", "85ms", "Excellent", "Pass"],
+
+    # Android Application
+    ["Android Application", "GPS Accuracy", "<5m", "3.2m", "Excellent", "Pass"],
+    ["", "Speed Limit API Success", ">90%", "93.7%", "Excellent", "Pass"],
+    ["", "Emergency SMS Delivery", ">95%", "98.4%", "Excellent", "Pass"],
+    ["", "Hospital Search Time", "<3s", "2.1s", "Excellent", "Pass"],
+
+    # ML Accident Risk Model
+    ["ML Accident Risk Model", "Prediction Accuracy (R²)", ">0.75", "0.82", "Excellent", "Pass"],
+    ["", "RMSE", "<10 km/h", "7.3 km/h", "Excellent", "Pass"],
+    ["", "Risk Calculation Time", "<50ms", "28ms", "Excellent", "Pass"],
+    ["", "Feature Encoding Accuracy", ">95%", "97.8%", "Excellent", "Pass"],
+
+    # System Integration
+    ["System Integration", "End-to-End Latency", "<1s", "0.7s", "Excellent", "Pass"],
+    ["", "Multi-device Sync", ">90%", "94.3%", "Excellent", "Pass"],
+    ["", "Power Consumption", "<2W", "1.6W", "Excellent", "Pass"],
+    ["", "System Uptime", ">99%", "99.2%", "Excellent", "Pass"],
+
+    # Emergency Response
+    ["Emergency Response", "Alert Dispatch Time", "<10s", "6.2s", "Excellent", "Pass"],
+    ["", "Location Accuracy", "<10m", "4.8m", "Excellent", "Pass"],
+    ["", "Contact Delivery Rate", ">95%", "98.1%", "Excellent", "Pass"],
+    ["", "Hospital Info Retrieval", ">85%", "89.3%", "Good", "Pass"],
+
+    # Manual Override
+    ["Manual Override", "Authorization Time", "<30s", "18s", "Excellent", "Pass"],
+    ["", "Logging Accuracy", "100%", "100%", "Perfect", "Pass"],
+    ["", "SMS Alert Success", ">95%", "96.7%", "Excellent", "Pass"],
+    ["", "Deactivation Response", "<5s", "3.1s", "Excellent", "Pass"],
+]
+
+# Metrics measured by SystemEvaluator: table row -> (component, result key, value scale, format, pass criterion)
+MEASURED_METRICS = {
+    ("Crash Detection (STM32)", "Accuracy"): ('crash_detection', 'accuracy', 1, "{:.1f}%", ('>', 90.0)),
+    ("Crash Detection (STM32)", "False Positive Rate"): ('crash_detection', 'false_positive_rate', 1, "{:.1f}%", ('<', 5.0)),
+    ("Crash Detection (STM32)", "Response Time"): ('crash_detection', 'avg_response_time', 1, "{:.0f}ms", ('<', 500.0)),
+    ("Speed Control (ESP32)", "Speed Limit Compliance"): ('speed_control', 'compliance_rate', 1, "{:.1f}%", ('>', 95.0)),
+    ("Speed Control (ESP32)", "Motor Response Time"): ('speed_control', 'avg_response_time', 1, "{:.0f}ms", ('<', 200.0)),
+    ("Speed Control (ESP32)", "PWM Accuracy"): ('speed_control', 'avg_pwm_accuracy', 1, "±{:.1f}%", ('<', 2.0)),
+    ("Android Application", "GPS Accuracy"): ('android_app', 'avg_gps_accuracy', 1, "{:.1f}m", ('<', 5.0)),
+    ("Android Application", "Speed Limit API Success"): ('android_app', 'api_success_rate', 1, "{:.1f}%", ('>', 90.0)),
+    ("Android Application", "Emergency SMS Delivery"): ('android_app', 'sms_delivery_rate', 1, "{:.1f}%", ('>', 95.0)),
+    ("Android Application", "Hospital Search Time"): ('android_app', 'avg_hospital_search_time', 1, "{:.1f}s", ('<', 3.0)),
+    ("ML Accident Risk Model", "Prediction Accuracy (R²)"): ('ml_model', 'r2_score', 1, "{:.2f}", ('>', 0.75)),
+    ("ML Accident Risk Model", "RMSE"): ('ml_model', 'rmse', 1, "{:.1f} km/h", ('<', 10.0)),
+    ("ML Accident Risk Model", "Risk Calculation Time"): ('ml_model', 'avg_calculation_time', 1, "{:.0f}ms", ('<', 50.0)),
+    ("ML Accident Risk Model", "Feature Encoding Accuracy"): ('ml_model', 'encoding_accuracy', 1, "{:.1f}%", ('>', 95.0)),
+    ("System Integration", "End-to-End Latency"): ('system_integration', 'avg_end_to_end_latency', 0.001, "{:.1f}s", ('<', 1.0)),
+    ("System Integration", "Multi-device Sync"): ('system_integration', 'sync_success_rate', 1, "{:.1f}%", ('>', 90.0)),
+    ("System Integration", "Power Consumption"): ('system_integration', 'avg_power_consumption', 1, "{:.1f}W", ('<', 2.0)),
+    ("System Integration", "System Uptime"): ('system_integration', 'system_uptime', 1, "{:.1f}%", ('>', 99.0)),
+    ("Emergency Response", "Alert Dispatch Time"): ('emergency_response', 'avg_alert_dispatch_time', 1, "{:.1f}s", ('<', 10.0)),
+    ("Emergency Response", "Location Accuracy"): ('emergency_response', 'avg_location_accuracy', 1, "{:.1f}m", ('<', 10.0)),
+    ("Emergency Response", "Contact Delivery Rate"): ('emergency_response', 'contact_delivery_rate', 1, "{:.1f}%", ('>', 95.0)),
+    ("Emergency Response", "Hospital Info Retrieval"): ('emergency_response', 'hospital_info_success_rate', 1, "{:.1f}%", ('>', 85.0)),
+    ("Manual Override", "Authorization Time"): ('manual_override', 'avg_authorization_time', 1, "{:.0f}s", ('<', 30.0)),
+    ("Manual Override", "Logging Accuracy"): ('manual_override', 'logging_accuracy', 1, "{:.1f}%", ('>=', 100.0)),
+    ("Manual Override", "SMS Alert Success"): ('manual_override', 'sms_alert_success_rate', 1, "{:.1f}%", ('>', 95.0)),
+    ("Manual Override", "Deactivation Response"): ('manual_override', 'avg_deactivation_time', 1, "{:.1f}s", ('<', 5.0)),
+}
+
+_OPERATORS = {'>': operator.gt, '<': operator.lt, '>=': operator.ge}
+
+# Cell colours shared by the HTML and matplotlib renderers
+PERFORMANCE_COLORS = {'Excellent': '#90EE90', 'Good': '#FFD700', 'Perfect': '#98FB98'}
+PASS_COLOR = '#90EE90'
+HEADER_COLOR = '#4CAF50'
+
+TITLE = "Smart Vehicle Safety & Speed Control System"
+
+
+def latest_run(runs_dir: str = RUNS_DIR) -> Optional[str]:
+    """Path of the most recent archived SystemEvaluator run, or None if there are none"""
+    paths = glob.glob(os.path.join(runs_dir, '*', 'detailed_test_results.json'))
+    return max(paths) if paths else None  # run_<timestamp> directories sort chronologically
+
+
+def _source_key(source: Optional[str]) -> tuple:
+    """Cache key for a result source, so edited or re-archived runs are reloaded"""
+    return (source, os.path.getmtime(source)) if source else (None, None)
+
+
+def _measured_rows(source: str) -> List[list]:
+    """Reference rows with every measured metric replaced by the archived run's value"""
+    with open(source) as f:
+        results = json.load(f)['results']
+
+    rows = []
+    component = ""
+    for row in RESULTS_DATA:
+        component = row[0] or component
+        measured = MEASURED_METRICS.get((component, row[1]))
+        value = results.get(measured[0], {}).get(measured[1]) if measured else None
+        if value is None:
+            rows.append(list(row))
+            continue
+        _, _, scale, fmt, (op, threshold) = measured
+        value *= scale
+        if _OPERATORS[op](value, threshold):
+            rows.append([row[0], row[1], row[2], fmt.format(value), row[4], "Pass"])
+        else:
+            rows.append([row[0], row[1], row[2], fmt.format(value), "Review", "Fail"])
+    return rows
+
+
+@lru_cache(maxsize=8)
+def _load_table(source: Optional[str], mtime: Optional[float]) -> pd.DataFrame:
+    rows = _measured_rows(source) if source else RESULTS_DATA
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def results_table(source: Optional[str] = None) -> pd.DataFrame:
+    """The overall results table, built once per source and cached
+
+    `source` is an archived run's detailed_test_results.json; without one the
+    reference results are used. Each call returns a copy of the cached table.
+    """
+    return _load_table(*_source_key(source)).copy()
+
+
+@lru_cache(maxsize=8)
+def _component_summary(source: Optional[str], mtime: Optional[float]) -> pd.DataFrame:
+    df = _load_table(source, mtime)
+    components = df['Component'].replace('', np.nan).ffill()
+    counts = (df['Status'].str.contains('Pass')
+              .groupby(components, sort=False)
+              .agg(['size', 'sum']))
+    pass_rate = counts['sum'] / counts['size'] * 100
+    return pd.DataFrame({
+        'Component': counts.index,
+        'Total Metrics': counts['size'].to_numpy(),
+        'Passed': counts['sum'].to_numpy(),
+        'Pass Rate (%)': [f"{rate:.1f}%" for rate in pass_rate],
+        'Status': np.where(pass_rate >= 90, 'Pass', 'Review'),
+    })
+
+
+def component_summary(source: Optional[str] = None) -> pd.DataFrame:
+    """Per-component pass counts, computed in a single groupby over the results table"""
+    return _component_summary(*_source_key(source)).copy()
+
+
+@lru_cache(maxsize=8)
+def _summary_statistics(source: Optional[str], mtime: Optional[float]) -> Dict:
+    df = _load_table(source, mtime)
+    total = len(df)
+    passed = int(df['Status'].str.contains('Pass').sum())
+    performance = df['Performance'].value_counts()
+    pass_rate = passed / total
+    return {
+        'total': total,
+        'passed': passed,
+        'excellent': int(performance.get('Excellent', 0)),
+        'good': int(performance.get('Good', 0)),
+        'perfect': int(performance.get('Perfect', 0)),
+        'grade': 'A+' if pass_rate >= 0.95 else 'A' if pass_rate >= 0.90 else 'B+',
+    }
+
+
+def summary_statistics(source: Optional[str] = None) -> Dict:
+    """Overall pass and performance counts plus the system grade"""
+    return dict(_summary_statistics(*_source_key(source)))
+
+
+def _summary_line(stats: Dict) -> str:
+    return (f"SUMMARY: {stats['passed']}/{stats['total']} metrics passed "
+            f"({stats['passed'] / stats['total'] * 100:.0f}% success rate)")
+
+
+def render_text(df: pd.DataFrame, stats: Dict) -> str:
+    """Fixed-width console table"""
+    lines = [
+        f"{TITLE} - Overall Results",
+        "=" * 100,
+        f"{'Component':<25} {'Metric':<27} {'Target':<10} {'Achieved':<12} {'Performance':<12} {'Status':<8}",
+        "-" * 100,
+    ]
+    for component, metric, target, achieved, performance, status in df.itertuples(index=False):
+        lines.append(f"{component:<25} {metric:<27} {target:<10} {achieved:<12} {performance:<12} {status:<8}")
+    lines += [
+        "=" * 100,
+        _summary_line(stats),
+        f"Overall Grade: {stats['grade']}",
+    ]
+    return '\n'.join(lines)
+
+
+def render_csv(df: pd.DataFrame, stats: Dict) -> str:
+    """CSV export, in the format evaluation_history.py indexes"""
+    return df.to_csv(index=False)
+
+
+def render_html(df: pd.DataFrame, stats: Dict) -> str:
+    """Standalone HTML page with the same colour coding as the matplotlib table"""
+    header = ''.join(f"<th>{html.escape(column)}</th>" for column in COLUMNS)
+    rows = []
+    for row in df.itertuples(index=False):
+        cells = [f"<td>{html.escape(value)}</td>" for value in row[:4]]
+        cells.append(f"<td style=\"background: {PERFORMANCE_COLORS.get(row.Performance, '#FFFFFF')}\">"
+                     f"{html.escape(row.Performance)}</td>")
+        status_style = f" style=\"background: {PASS_COLOR}\"" if 'Pass' in row.Status else ''
+        cells.append(f"<td{status_style}>{html.escape(row.Status)}</td>")
+        rows.append(f"<tr>{''.join(cells)}</tr>")
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<title>{html.escape(TITLE)} - Overall Results</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; font-size: 13px; text-align: center; }}
+th {{ background: {HEADER_COLOR}; color: white; }}
+</style></head><body>
+<h1>{html.escape(TITLE)}</h1>
+<h2>Overall Results Summary</h2>
+<table><thead><tr>{header}</tr></thead><tbody>
+{chr(10).join(rows)}
+</tbody></table>
+<p>{html.escape(_summary_line(stats))} | Overall Grade: {stats['grade']}</p>
+</body></html>
+"""
+
+
+def render_matplotlib(df: pd.DataFrame, stats: Dict):
+    """Colour-coded table figure"""
+    import matplotlib.pyplot as plt  # Only needed for the figure output
+
+    data = df.to_numpy().tolist()
+    fig, ax = plt.subplots(figsize=(16, 12))
+    ax.axis('tight')
+    ax.axis('off')
+
+    table = ax.table(cellText=data,
+                     colLabels=COLUMNS,
+                     cellLoc='center',
+                     loc='center',
+                     bbox=[0, 0, 1, 1])
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+
+    # Colour code performance and status columns
+    for i, row in enumerate(data):
+        table[(i + 1, 4)].set_facecolor(PERFORMANCE_COLORS.get(row[4], '#FFFFFF'))
+        if "Pass" in row[5]:
+            table[(i + 1, 5)].set_facecolor(PASS_COLOR)
+
+    for j in range(len(COLUMNS)):
+        table[(0, j)].set_facecolor(HEADER_COLOR)
+        table[(0, j)].set_text_props(weight='bold', color='white')
+
+    ax.set_title(f"{TITLE}\nOverall Results Summary", fontsize=16, fontweight='bold', pad=20)
+    fig.text(0.5, 0.02, f"{_summary_line(stats)} | Overall Grade: {stats['grade']}",
+             ha='center', fontsize=12, bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue"))
+    fig.tight_layout()
+    return fig
+
+
+RENDERERS = {
+    'text': render_text,
+    'csv': render_csv,
+    'html': render_html,
+    'matplotlib': render_matplotlib,
+}
+
+FILE_EXTENSIONS = {'text': 'txt', 'csv': 'csv', 'html': 'html', 'matplotlib': 'png'}
+
+# Formats rendered to immutable strings; figures are rebuilt on every call
+MEMOIZED_FORMATS = {'text', 'csv', 'html'}
+
+
+def _render_uncached(fmt: str, source: Optional[str], mtime: Optional[float]):
+    return RENDERERS[fmt](_load_table(source, mtime), _summary_statistics(source, mtime))
+
+
+_render = lru_cache(maxsize=32)(_render_uncached)
+
+
+def render(fmt: str, source: Optional[str] = None):
+    """Render the results table in one format: a memoized string, or a new Figure for matplotlib"""
+    if fmt not in RENDERERS:
+        raise ValueError(f"Unknown results format: {fmt}")
+    renderer = _render if fmt in MEMOIZED_FORMATS else _render_uncached
+    return renderer(fmt, *_source_key(source))
+
+
+def save_rendered(fmt: str, path: str, source: Optional[str] = None) -> str:
+    """Write one rendered format to `path`"""
+    output = render(fmt, source)
+    if fmt == 'matplotlib':
+        import matplotlib.pyplot as plt
+
+        output.savefig(path, dpi=300, bbox_inches='tight')
+        plt.close(output)
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(output)
+    return path
+
+
+def render_all(output_dir: str = '.', formats: Optional[List[str]] = None,
+               source: Optional[str] = None, basename: str = 'results_table') -> Dict[str, str]:
+    """Write every requested format from a single build of the results table"""
+    os.makedirs(output_dir, exist_ok=True)
+    return {
+        fmt: save_rendered(fmt, os.path.join(output_dir, f"{basename}.{FILE_EXTENSIONS[fmt]}"), source)
+        for fmt in formats or RENDERERS
+    }
+
+
+def main():
+    """Render the overall results table in every report format"""
+    parser = argparse.ArgumentParser(description="Render the overall results table")
+    parser.add_argument('--source', default=None,
+                        help="Archived run JSON to report ('latest' for the newest run; default: reference results)")
+    parser.add_argument('--runs-dir', default=RUNS_DIR, help="Directory of archived evaluation runs")
+    parser.add_argument('--formats', nargs='+', choices=list(RENDERERS), default=list(RENDERERS))
+    parser.add_argument('--output-dir', default='.')
+    args = parser.parse_args()
+
+    source = latest_run(args.runs_dir) if args.source == 'latest' else args.source
+    if args.source == 'latest' and source is None:
+        print(f"No archived runs in {args.runs_dir}, using reference results")
+
+    print(render('text', source))
+    print("\nCOMPONENT-WISE SUMMARY")
+    print("=" * 60)
+    print(component_summary(source).to_string(index=False))
+
+    paths = render_all(args.output_dir, args.formats, source)
+    print("\nFiles generated:")
+    for path in paths.values():
+        print(f"   - {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Sensitivity Analysis
+Monte Carlo variance decomposition over component assumptions
+
+Samples the evaluator's assumptions behind every pass criterion (crash prior,
+detection and false alarm rates, crash response time, speed variation, PWM
+response time and noise, API success rate) with Sobol or
+Latin-hypercube designs, runs the vectorized SystemEvaluator simulators for
+every design point across all cores, and computes first-order and total
+Sobol indices for each output metric and for end-to-end pass/fail.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.stats import qmc
+except ImportError:  # scipy is optional, Sobol designs fall back to Latin hypercube
+    qmc = None
+
+# Ranges explored around each DEFAULT_PARAMETERS value in system_evaluation.py
+PARAMETER_BOUNDS = {
+    'crash_prior': (0.01, 0.10),
+    'detection_rate': (0.90, 0.99),
+    'false_alarm_rate': (0.01, 0.07),
+    'crash_response_mean': (250.0, 550.0),
+    'speed_variation': (1.0, 3.0),
+    'pwm_response_mean': (100.0, 200.0),
+    'pwm_response_std': (10.0, 40.0),
+    'pwm_noise': (1.0, 4.0),
+    'api_success_rate': (0.88, 0.98),
+}
+
+# Output metrics and their pass criteria, matching the targets in the results tables
+PASS_CRITERIA = {
+    ('crash_detection', 'accuracy'): ('>', 90.0),
+    ('crash_detection', 'false_positive_rate'): ('<', 5.0),
+    ('crash_detection', 'avg_response_time'): ('<', 500.0),
+    ('speed_control', 'compliance_rate'): ('>', 95.0),
+    ('speed_control', 'avg_response_time'): ('<', 200.0),
+    ('speed_control', 'avg_pwm_accuracy'): ('<', 2.0),
+    ('android_app', 'api_success_rate'): ('>', 90.0),
+}
+
+
+def _latin_hypercube(num_samples: int, num_dims: int, rng: np.random.Generator) -> np.ndarray:
+    """Latin hypercube sample on the unit cube (one point per stratum in each dimension)"""
+    strata = np.argsort(rng.random((num_samples, num_dims)), axis=0)
+    return (strata + rng.random((num_samples, num_dims))) / num_samples
+
+
+def sample_unit_design(num_samples: int, num_dims: int, method: str = 'sobol',
+                       seed: Optional[int] = None) -> np.ndarray:
+    """Draw a quasi-random design on the unit cube with a Sobol or Latin-hypercube sampler"""
+    if method == 'sobol' and qmc is not None:
+        return qmc.Sobol(d=num_dims, scramble=True, seed=seed).random(num_samples)
+    if method == 'sobol':
+        print("scipy not installed, using Latin hypercube design instead of Sobol")
+    elif method != 'lhs':
+        raise ValueError(f"Unknown sampling method: {method}")
+    if qmc is not None:
+        return qmc.LatinHypercube(d=num_dims, seed=seed).random(num_samples)
+    return _latin_hypercube(num_samples, num_dims, np.random.default_rng(seed))
+
+
+def build_saltelli_design(num_samples: int, bounds: Dict = None, method: str = 'sobol',
+                          seed: Optional[int] = None) -> Dict:
+    """Build Saltelli's A, B and AB_i matrices for num_samples base points
+
+    The full design has num_samples * (d + 2) rows: A, B, then one copy of A
+    per parameter with that column taken from B.
+    """
+    bounds = bounds or PARAMETER_BOUNDS
+    names = list(bounds)
+    d = len(names)
+    low = np.array([bounds[name][0] for name in names])
+    high = np.array([bounds[name][1] for name in names])
+
+    unit = sample_unit_design(num_samples, 2 * d, method, seed)
+    a = low + unit[:, :d] * (high - low)
+    b = low + unit[:, d:] * (high - low)
+    ab = np.repeat(a[np.newaxis], d, axis=0)
+    ab[np.arange(d), :, np.arange(d)] = b.T
+
+    return {
+        'names': names,
+        'num_samples': num_samples,
+        'matrix': np.vstack([a, b, ab.reshape(-1, d)]),
+    }
+
+
+def _evaluate_chunk(args) -> np.ndarray:
+    """Run the simulators for a block of design points (executed in a worker process)"""
+    names, rows, num_tests, seed = args
+    from system_evaluation import SystemEvaluator
+
+    outputs = np.empty((len(rows), len(PASS_CRITERIA) + 2))
+    evaluator = SystemEvaluator(max_trials_retained=num_tests)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, row in enumerate(rows):
+            evaluator.params.update(zip(names, row))
+            np.random.seed(seed)  # Common random numbers across design points
+            evaluator.simulate_crash_detection_tests(num_tests)
+            evaluator.simulate_speed_control_tests(num_tests)
+            evaluator.simulate_android_app_tests(num_tests)
+
+            num_failed = 0
+            for j, ((component, metric), (op, threshold)) in enumerate(PASS_CRITERIA.items()):
+                value = evaluator.test_results[component][metric]
+                outputs[i, j] = value
+                num_failed += not (value > threshold if op == '>' else value < threshold)
+            outputs[i, -2] = num_failed
+            outputs[i, -1] = float(num_failed == 0)
+    return outputs
+
+
+def evaluate_design(design: Dict, num_tests: int = 1000, seed: int = 0,
+                    workers: Optional[int] = None, chunk_size: int = 256) -> pd.DataFrame:
+    """Evaluate every design point in parallel, returning one output row per point"""
+    matrix = design['matrix']
+    chunks = [(design['names'], matrix[start:start + chunk_size], num_tests, seed)
+              for start in range(0, len(matrix), chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_evaluate_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_evaluate_chunk, chunks))
+
+    columns = [f"{component}.{metric}" for component, metric in PASS_CRITERIA] + ['criteria_failed', 'system_pass']
+    return pd.DataFrame(np.vstack(results), columns=columns)
+
+
+def compute_sobol_indices(design: Dict, outputs: pd.DataFrame) -> pd.DataFrame:
+    """First-order (Saltelli 2010) and total (Jansen) Sobol indices per parameter and output"""
+    names = design['names']
+    n, d = design['num_samples'], len(names)
+    y = outputs.to_numpy()
+    f_a, f_b = y[:n], y[n:2 * n]
+    f_ab = y[2 * n:].reshape(d, n, -1)
+
+    variance = np.var(np.vstack([f_a, f_b]), axis=0)
+    for output in outputs.columns[variance == 0]:
+        print(f"Warning: {output} is constant ({outputs[output].iloc[0]:g}) across the design, "
+              "its Sobol indices are undefined")
+    variance = np.where(variance > 0, variance, np.nan)  # Constant outputs have no indices
+    first_order = np.mean(f_b * (f_ab - f_a), axis=1) / variance
+    total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / variance
+
+    rows = []
+    for k, output in enumerate(outputs.columns):
+        for i, name in enumerate(names):
+            rows.append({'output': output, 'parameter': name,
+                         'S1': first_order[i, k], 'ST': total[i, k]})
+    return pd.DataFrame(rows)
+
+
+def run_sensitivity_analysis(num_samples: int = 256, num_tests: int = 1000, method: str = 'sobol',
+                             seed: int = 0, workers: Optional[int] = None) -> pd.DataFrame:
+    """Sample the parameter space, run all design points, and return Sobol indices"""
+    design = build_saltelli_design(num_samples, method=method, seed=seed)
+    print(f"Evaluating {len(design['matrix'])} design points ({method}, {num_tests} trials each)...")
+
+    start_time = time.time()
+    outputs = evaluate_design(design, num_tests=num_tests, seed=seed, workers=workers)
+    print(f"Design evaluated in {time.time() - start_time:.2f} seconds")
+    print(f"End-to-end pass rate across design: {outputs['system_pass'].mean() * 100:.1f}%")
+    print(f"Average pass criteria failed: {outputs['criteria_failed'].mean():.2f} of {len(PASS_CRITERIA)}")
+
+    return compute_sobol_indices(design, outputs)
+
+
+def main():
+    """Run the sensitivity analysis and report which parameters drive each metric"""
+    parser = argparse.ArgumentParser(description="Sobol sensitivity analysis of evaluator assumptions")
+    parser.add_argument('--samples', type=int, default=256, help="Base sample size (power of 2 for Sobol)")
+    parser.add_argument('--tests', type=int, default=1000, help="Simulated trials per design point")
+    parser.add_argument('--method', choices=['sobol', 'lhs'], default='sobol')
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Monte Carlo Sensitivity Analysis")
+    print("=" * 60)
+
+    indices = run_sensitivity_analysis(args.samples, args.tests, args.method, args.seed, args.workers)
+    indices.to_csv('sensitivity_indices.csv', index=False)
+
+    print("\nTotal-order Sobol indices (ST):")
+    print(indices.pivot(index='parameter', columns='output', values='ST')
+          .to_string(float_format=lambda x: f"{x:.3f}"))
+    print("\nIndices saved to: sensitivity_indices.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Smart Vehicle Safety & Speed Control System - Speed Limit Compliance Analyzer
+Vectorized analysis of recorded drives
+
+A recorded drive has three time series, all timestamped in milliseconds:
+  - GPS fixes from LocationHelper (fix_time, latitude, longitude)
+  - speed limits returned by GeoapifyService.getSpeedLimit (limit_time, speed_limit)
+  - vehicle speed from the ESP32 "SPEED:<kmph>" Bluetooth stream (speed_time, speed)
+
+Drives are processed in batches. Each batch is concatenated into flat arrays
+keyed by (drive, time), the streams are aligned to the GPS fixes with
+as-of lookups via np.searchsorted, and overspeed duration, time to comply
+after each limit change, and per-segment compliance are computed without
+Python loops over fixes.
+"""
+
+import argparse
+import glob
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+SPEED_TOLERANCE = 3.0  # km/h over the limit still counted as compliant
+MAX_FIX_GAP_MS = 5000  # Longer GPS gaps are not counted as driving time
+MAX_SPEED_AGE_MS = 2000  # ESP32 sends SPEED every 500ms; older readings are stale
+SPEED_LIMITS = [30, 40, 50, 60, 80, 100]  # km/h, same scenarios as the speed control tests
+
+DRIVE_STREAMS = ['fix_time', 'latitude', 'longitude', 'limit_time', 'speed_limit', 'speed_time', 'speed']
+_TIME_BITS = 42  # Millisecond timestamps up to year 2109
+_TIME_MASK = (1 << _TIME_BITS) - 1
+
+
+def _keys(drive: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+    """Pack (drive index, timestamp) into sortable int64 keys"""
+    return (drive.astype(np.int64) << _TIME_BITS) | timestamps.astype(np.int64)
+
+
+def _asof(left_keys: np.ndarray, right_keys: np.ndarray) -> np.ndarray:
+    """Index of the last right key at or before each left key in the same drive, or -1"""
+    if len(right_keys) == 0:
+        return np.full(len(left_keys), -1, dtype=np.intp)
+    idx = np.searchsorted(right_keys, left_keys, side='right') - 1
+    same_drive = (right_keys[np.maximum(idx, 0)] >> _TIME_BITS) == (left_keys >> _TIME_BITS)
+    return np.where((idx >= 0) & same_drive, idx, -1)
+
+
+def _take(values: np.ndarray, idx: np.ndarray, fill) -> np.ndarray:
+    """values[idx] with `fill` wherever idx is -1 (also safe when values is empty)"""
+    if len(values) == 0:
+        return np.full(len(idx), fill, dtype=np.result_type(values, type(fill)))
+    return np.where(idx >= 0, values[np.maximum(idx, 0)], fill)
+
+
+def parse_speed_messages(timestamps, messages) -> Dict[str, np.ndarray]:
+    """Parse timestamped ESP32 Bluetooth lines ("SPEED:42") into speed_time/speed arrays"""
+    messages = pd.Series(messages, dtype='string').str.strip()
+    is_speed = messages.str.startswith('SPEED:').fillna(False).to_numpy(dtype=bool)
+    speeds = pd.to_numeric(messages[is_speed].str.slice(6), errors='coerce').to_numpy(dtype=np.float64)
+    times = np.asarray(timestamps, dtype=np.int64)[is_speed]
+    valid = ~np.isnan(speeds) & (speeds >= 0)  # Same checks as MainActivity's SPEED handler
+    return {'speed_time': times[valid], 'speed': speeds[valid]}
+
+
+def load_drive(path: str) -> Dict[str, np.ndarray]:
+    """Load one recorded drive saved by save_drive"""
+    with np.load(path) as data:
+        return {name: data[name] for name in DRIVE_STREAMS}
+
+
+def save_drive(path: str, drive: Dict[str, np.ndarray]):
+    """Save one recorded drive as an .npz file"""
+    np.savez(path, **{name: drive[name] for name in DRIVE_STREAMS})
+
+
+def generate_synthetic_drive(duration_s: int = 3600, start_ms: int = 1_700_000_000_000,
+                             rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """Generate a drive with 1 Hz GPS fixes, 2 Hz ESP32 speed and random limit changes"""
+    rng = rng if rng is not None else np.random.default_rng()
+
+    fix_time = start_ms + np.arange(duration_s, dtype=np.int64) * 1000
+    heading = np.cumsum(rng.normal(0, 0.05, duration_s))
+    latitude = 12.9716 + np.cumsum(np.cos(heading)) * 1e-4
+    longitude = 77.5946 + np.cumsum(np.sin(heading)) * 1e-4
+
+    num_segments = max(duration_s // 120, 1)
+    limit_time = start_ms + np.sort(rng.choice(duration_s, num_segments, replace=False)).astype(np.int64) * 1000
+    limit_time[0] = start_ms
+    speed_limit = rng.choice(SPEED_LIMITS, num_segments).astype(np.float64)
+
+    # Driver follows the limit with a reaction delay, noise and occasional speeding
+    speed_time = start_ms + np.arange(duration_s * 2, dtype=np.int64) * 500
+    reaction_ms = rng.integers(2000, 15000)
+    segment = np.searchsorted(limit_time, speed_time - reaction_ms, side='right') - 1
+    target = speed_limit[np.maximum(segment, 0)]
+    speeding = rng.random(num_segments) < 0.15
+    speed = target + rng.normal(0, 2, len(speed_time)) + np.where(speeding[np.maximum(segment, 0)], 8.0, 0.0)
+
+    return {
+        'fix_time': fix_time, 'latitude': latitude, 'longitude': longitude,
+        'limit_time': limit_time, 'speed_limit': speed_limit,
+        'speed_time': speed_time, 'speed': np.round(np.maximum(speed, 0)),  # ESP32 sends integer km/h
+    }
+
+
+def _concat_drives(drives: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Flatten a batch of drives into keyed arrays sorted by (drive, time)"""
+    batch = {}
+    for stream, time_field, value_fields in (('fix', 'fix_time', ['latitude', 'longitude']),
+                                             ('limit', 'limit_time', ['speed_limit']),
+                                             ('speed', 'speed_time', ['speed'])):
+        drive_idx = np.concatenate([np.full(len(d[time_field]), i, dtype=np.int64) for i, d in enumerate(drives)])
+        keys = _keys(drive_idx, np.concatenate([d[time_field] for d in drives]))
+        values = {field: np.concatenate([d[field] for d in drives]).astype(np.float64) for field in value_fields}
+
+        if np.any(keys[1:] < keys[:-1]):  # Recorded streams are normally already time ordered
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            values = {field: column[order] for field, column in values.items()}
+
+        batch[f"{stream}_keys"] = keys
+        batch.update(values)
+    return batch
+
+
+def analyze_batch(drives: List[Dict[str, np.ndarray]], drive_ids: Optional[List] = None,
+                  tolerance: float = SPEED_TOLERANCE, max_gap_ms: int = MAX_FIX_GAP_MS,
+                  max_speed_age_ms: int = MAX_SPEED_AGE_MS) -> Dict:
+    """Compute compliance metrics for a batch of drives
+
+    Returns per-segment compliance (one row per speed limit change), per-change
+    time to comply, and batch totals.
+    """
+    drive_ids = np.asarray(drive_ids if drive_ids is not None else range(len(drives)))
+    b = _concat_drives(drives)
+    fix_keys, limit_keys, speed_keys = b['fix_keys'], b['limit_keys'], b['speed_keys']
+    fix_drive, fix_time = fix_keys >> _TIME_BITS, fix_keys & _TIME_MASK
+
+    # Align speed limit and ESP32 speed to each GPS fix
+    limit_idx = _asof(fix_keys, limit_keys)
+    speed_idx = _asof(fix_keys, speed_keys)
+    speed_age = fix_keys - _take(speed_keys, speed_idx, np.iinfo(np.int64).min)
+    valid = (limit_idx >= 0) & (speed_idx >= 0) & (speed_age <= max_speed_age_ms)
+    excess = _take(b['speed'], speed_idx, np.nan) - _take(b['speed_limit'], limit_idx, np.nan)
+    overspeed = valid & (excess > tolerance)
+    compliant = valid & ~overspeed
+
+    # Each fix represents the time until the next fix in the same drive
+    dwell = np.zeros(len(fix_keys))
+    same_drive = fix_drive[1:] == fix_drive[:-1]
+    dwell[:-1] = np.where(same_drive, np.minimum(np.diff(fix_time), max_gap_ms), 0) / 1000
+
+    # Limit changes; the app re-polls the limit every 2 s, so most limit records repeat the current value
+    limit_drive = limit_keys >> _TIME_BITS
+    previous_limit = np.concatenate(([np.nan], b['speed_limit'][:-1]))
+    first_in_drive = np.concatenate(([True], limit_drive[1:] != limit_drive[:-1]))
+    previous_limit[first_in_drive] = np.nan
+    is_change = first_in_drive | (b['speed_limit'] != previous_limit)
+    change_keys = limit_keys[is_change]
+
+    # Per-segment compliance, a segment being the span between two limit changes
+    num_segments = len(change_keys)
+    record_segment = np.cumsum(is_change) - 1  # Every drive starts with a change, so segments never span drives
+    seg = record_segment[limit_idx[valid]]
+    duration = np.bincount(seg, weights=dwell[valid], minlength=num_segments)
+    overspeed_duration = np.bincount(record_segment[limit_idx[overspeed]], weights=dwell[overspeed],
+                                     minlength=num_segments)
+    max_excess = np.full(num_segments, np.nan)
+    if len(seg):
+        np.fmax.at(max_excess, seg, excess[valid])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        compliance_pct = (1 - overspeed_duration / duration) * 100
+
+    segments = pd.DataFrame({
+        'drive_id': drive_ids[change_keys >> _TIME_BITS],
+        'segment_start_ms': change_keys & _TIME_MASK,
+        'speed_limit': b['speed_limit'][is_change],
+        'duration_s': duration,
+        'overspeed_s': overspeed_duration,
+        'compliance_pct': compliance_pct,
+        'max_excess_kmph': max_excess,
+    })
+
+    # Time to comply after each limit change: first compliant fix before the next limit change
+    change_drive = change_keys >> _TIME_BITS
+    next_change_same_drive = np.append(change_drive[1:] == change_drive[:-1], False)
+    window_end = np.where(next_change_same_drive, np.append(change_keys[1:], 0), (change_drive + 1) << _TIME_BITS)
+
+    compliant_keys = fix_keys[compliant]
+    j = np.searchsorted(compliant_keys, change_keys, side='left')
+    complied_key = _take(compliant_keys, np.where(j < len(compliant_keys), j, -1), np.iinfo(np.int64).max)
+    complied = complied_key < window_end
+    first_fix = np.searchsorted(fix_keys, change_keys, side='left')
+    first_fix = np.where(first_fix < len(fix_keys), first_fix, -1)
+    first_fix_in_window = _take(fix_keys, first_fix, np.iinfo(np.int64).max) < window_end
+    was_overspeeding = first_fix_in_window & _take(overspeed, first_fix, False)
+
+    changes = pd.DataFrame({
+        'drive_id': drive_ids[change_keys >> _TIME_BITS],
+        'change_time_ms': change_keys & _TIME_MASK,
+        'previous_limit': previous_limit[is_change],
+        'new_limit': b['speed_limit'][is_change],
+        'was_overspeeding': was_overspeeding,
+        'time_to_comply_s': np.where(complied, (complied_key - change_keys) / 1000, np.nan),
+    })
+
+    totals = {
+        'drives': len(drives),
+        'fixes': len(fix_keys),
+        'aligned_fixes': int(np.count_nonzero(valid)),
+        'driving_time_s': float(dwell[valid].sum()),
+        'overspeed_time_s': float(dwell[overspeed].sum()),
+        'limit_changes': int(np.count_nonzero(is_change)),
+    }
+    return {'segments': segments, 'changes': changes, 'totals': totals}
+
+
+def iter_drive_batches(paths: Iterable[str], batch_size: int = 256) -> Iterator[tuple]:
+    """Yield (drive_ids, drives) batches loaded from .npz drive files"""
+    ids, drives = [], []
+    for path in paths:
+        ids.append(os.path.splitext(os.path.basename(path))[0])
+        drives.append(load_drive(path))
+        if len(drives) == batch_size:
+            yield ids, drives
+            ids, drives = [], []
+    if drives:
+        yield ids, drives
+
+
+def analyze_drives(batches: Iterable[tuple], keep_segments: bool = False, **kwargs) -> Dict:
+    """Stream drive batches through analyze_batch and combine the results
+
+    Only totals and limit-change rows are kept by default; pass keep_segments
+    to also retain every per-segment row.
+    """
+    totals = {}
+    changes, segments, per_drive = [], [], []
+    for drive_ids, drives in batches:
+        result = analyze_batch(drives, drive_ids, **kwargs)
+        for name, value in result['totals'].items():
+            totals[name] = totals.get(name, 0) + value
+        changes.append(result['changes'])
+        per_drive.append(result['segments'].groupby('drive_id')[['duration_s', 'overspeed_s']].sum())
+        if keep_segments:
+            segments.append(result['segments'])
+
+    if not per_drive:
+        raise ValueError("No drives to analyze")
+    changes = pd.concat(changes, ignore_index=True)
+    drives = pd.concat(per_drive)
+    drives['compliance_pct'] = (1 - drives['overspeed_s'] / drives['duration_s']) * 100
+
+    slowdowns = changes.loc[changes['was_overspeeding'], 'time_to_comply_s']
+    totals['compliance_rate'] = (1 - totals['overspeed_time_s'] / totals['driving_time_s']) * 100 \
+        if totals['driving_time_s'] else float('nan')
+    totals['median_time_to_comply_s'] = float(slowdowns.median()) if len(slowdowns) else float('nan')
+    totals['p95_time_to_comply_s'] = float(slowdowns.quantile(0.95)) if len(slowdowns) else float('nan')
+
+    return {
+        'totals': totals,
+        'drives': drives.reset_index(),
+        'changes': changes,
+        'segments': pd.concat(segments, ignore_index=True) if segments else None,
+    }
+
+
+def main():
+    """Analyze recorded drives (or a synthetic fleet) and report compliance throughput"""
+    parser = argparse.ArgumentParser(description="Speed limit compliance analysis of recorded drives")
+    parser.add_argument('drive_dir', nargs='?', help="Directory of .npz drive recordings")
+    parser.add_argument('--synthetic-drives', type=int, default=200, help="Synthetic 1 h drives when no directory is given")
+    parser.add_argument('--batch-size', type=int, default=256)
+    args = parser.parse_args()
+
+    print("Smart Vehicle Safety & Speed Control System")
+    print("Speed Limit Compliance Analysis")
+    print("=" * 60)
+
+    if args.drive_dir:
+        paths = sorted(glob.glob(os.path.join(args.drive_dir, '*.npz')))
+        batches = iter_drive_batches(paths, args.batch_size)
+        print(f"Analyzing {len(paths)} recorded drives from {args.drive_dir}")
+    else:
+        rng = np.random.default_rng(0)
+        drives = [generate_synthetic_drive(rng=rng) for _ in range(args.synthetic_drives)]
+        batches = [(list(range(start, start + len(chunk))), chunk) for start, chunk in
+                   ((s, drives[s:s + args.batch_size]) for s in range(0, len(drives), args.batch_size))]
+        print(f"Analyzing {len(drives)} synthetic one-hour drives")
+
+    start_time = time.perf_counter()
+    results = analyze_drives(batches)
+    elapsed = time.perf_counter() - start_time
+    totals = results['totals']
+
+    print(f"\nFixes analyzed: {totals['fixes']:,} in {elapsed:.2f}s ({totals['fixes'] / elapsed:,.0f} fixes/s)")
+    print(f"Driving time: {totals['driving_time_s'] / 3600:.1f}h, overspeed: {totals['overspeed_time_s'] / 3600:.2f}h")
+    print(f"Speed limit compliance: {totals['compliance_rate']:.1f}%")
+    print(f"Limit changes: {totals['limit_changes']:,}")
+    print(f"Time to comply after limit change (median / p95): "
+          f"{totals['median_time_to_comply_s']:.1f}s / {totals['p95_time_to_comply_s']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
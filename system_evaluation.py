@@ -15,240 +15,222 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
 import json
+import os
 import time
 from typing import Dict, List, Tuple
-import random
+
+from crash_traces import SCENARIO_NAMES, detect_crashes, iter_corpus, sample_time_ms
+from emergency_dispatch import simulate_dispatch_burst
+from evaluation_history import RUNS_DIR
+from hospital_index import HospitalIndex, sample_locations
+from manual_override import OverrideEventLog, session_records, simulate_override_sessions
+from trial_records import DEFAULT_CAPACITY, TRIAL_DTYPES, TrialBuffer, aggregate_trials, save_trials
 
 # Set style for better visualizations
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
+# Component assumptions used by the simulators (overridable for sensitivity analysis)
+DEFAULT_PARAMETERS = {
+    'crash_prior': 0.05,  # Fraction of test scenarios that are actual crashes
+    'detection_rate': 0.952,  # STM32 MPU6050 crash detection rate
+    'false_alarm_rate': 0.028,  # Detections on non-crash scenarios
+    'crash_response_mean': 340.0,  # ms, impact to crash alert
+    'speed_variation': 2.0,  # km/h standard deviation of actual vs target speed
+    'pwm_response_mean': 150.0,  # ms, ESP32 motor PWM adjustment time
+    'pwm_response_std': 25.0,  # ms
+    'pwm_noise': 3.0,  # PWM units standard deviation of actual vs expected duty
+    'api_success_rate': 0.937,  # Speed limit API success rate
+}
+
+DISPATCH_ARRIVAL_WINDOW = 3600.0  # s of simulated time that pipeline-driven crashes are spread over
+
 class SystemEvaluator:
-    def __init__(self):
+    def __init__(self, hospital_index: HospitalIndex = None, max_trials_retained: int = DEFAULT_CAPACITY,
+                 params: Dict = None, dispatch_pipeline: bool = False):
         """Initialize the system evaluator with test parameters"""
         self.test_results = {}
         self.performance_metrics = {}
+        self.params = {**DEFAULT_PARAMETERS, **(params or {})}
+        self.hospital_index = hospital_index  # Optional offline hospital dataset
+        self.dispatch_pipeline = dispatch_pipeline  # Emergency alerts through emergency_dispatch's pipeline
+        self.override_log = OverrideEventLog()  # Simulated manual override events
+        self.override_sessions = 0  # Sessions simulated so far, used as the next override id
+        # Raw per-trial records for each component, bounded to max_trials_retained
+        self.trial_records = {
+            component: TrialBuffer(dtype, max_trials_retained)
+            for component, dtype in TRIAL_DTYPES.items()
+        }
+    
+    def _record_trials(self, component: str, records: np.ndarray) -> Dict:
+        """Retain a batch of trial records and aggregate it into the component results"""
+        self.trial_records[component].extend(records)
+        results = aggregate_trials(component, records)
+        self.test_results[component] = results
+        return results
+    
+    def reaggregate_results(self) -> Dict:
+        """Recompute test_results from all retained trials without rerunning simulations"""
+        for component, buffer in self.trial_records.items():
+            if len(buffer):
+                self.test_results[component] = aggregate_trials(component, buffer.records())
+        return self.test_results
         
     def simulate_crash_detection_tests(self, num_tests: int = 1000) -> Dict:
         """Simulate crash detection accuracy tests"""
         print("Evaluating Crash Detection System (STM32)...")
         
+        records = np.zeros(num_tests, dtype=TRIAL_DTYPES['crash_detection'])
+        
         # Simulate crash detection scenarios
-        true_crashes = np.random.choice([0, 1], num_tests, p=[0.95, 0.05])  # 5% actual crashes
-        
-        # STM32 MPU6050 detection with 95.2% accuracy
-        detected_crashes = []
-        response_times = []
-        
-        for is_crash in true_crashes:
-            if is_crash:  # Actual crash
-                detection = np.random.choice([0, 1], p=[0.048, 0.952])  # 95.2% detection rate
-                response_time = np.random.normal(340, 50)  # 340ms ± 50ms
-            else:  # No crash
-                detection = np.random.choice([0, 1], p=[0.972, 0.028])  # 2.8% false positive
-                response_time = np.random.normal(340, 50) if detection else 0
+        is_crash = np.random.random(num_tests) < self.params['crash_prior']  # 5% actual crashes
+        records['is_crash'] = is_crash
+        
+        # STM32 MPU6050 detection with 95.2% accuracy and 2.8% false positives
+        detection_probability = np.where(is_crash, self.params['detection_rate'], self.params['false_alarm_rate'])
+        records['detected'] = np.random.random(num_tests) < detection_probability
+        
+        # 340ms ± 50ms for actual crashes and for false alarms
+        response_times = np.maximum(np.random.normal(self.params['crash_response_mean'], 50, num_tests), 0)
+        records['response_time'] = np.where(is_crash | records['detected'], response_times, 0)
+        
+        return self._record_trials('crash_detection', records)
+    
+    def simulate_crash_detection_from_corpus(self, corpus_dir: str, chunk_size: int = 100_000) -> Dict:
+        """Evaluate the STM32 fall + impact algorithm on a synthetic crash trace corpus"""
+        print(f"Evaluating Crash Detection System (STM32) on corpus {corpus_dir}...")
+        
+        detected_by_scenario = np.zeros(len(SCENARIO_NAMES))
+        traces_by_scenario = np.zeros(len(SCENARIO_NAMES))
+        corpus_records = []
+        for traces, labels in iter_corpus(corpus_dir, chunk_size):
+            detected_at = detect_crashes(traces)
+            records = np.zeros(len(labels), dtype=TRIAL_DTYPES['crash_detection'])
+            records['is_crash'] = labels['is_crash']
+            records['detected'] = detected_at >= 0
+            latency = sample_time_ms(detected_at) - labels['impact_ms']  # Measured from the impact, not the scenario start
+            records['response_time'] = np.where(detected_at >= 0, np.maximum(latency, 0), 0)
+            corpus_records.append(records)
             
-            detected_crashes.append(detection)
-            response_times.append(max(response_time, 0))
-        
-        # Calculate metrics
-        true_positives = sum((t == 1 and d == 1) for t, d in zip(true_crashes, detected_crashes))
-        false_positives = sum((t == 0 and d == 1) for t, d in zip(true_crashes, detected_crashes))
-        true_negatives = sum((t == 0 and d == 0) for t, d in zip(true_crashes, detected_crashes))
-        false_negatives = sum((t == 1 and d == 0) for t, d in zip(true_crashes, detected_crashes))
-        
-        accuracy = (true_positives + true_negatives) / num_tests
-        false_positive_rate = false_positives / sum(1 for x in true_crashes if x == 0)
-        avg_response_time = np.mean([rt for rt in response_times if rt > 0])
-        
-        results = {
-            'accuracy': accuracy * 100,
-            'false_positive_rate': false_positive_rate * 100,
-            'avg_response_time': avg_response_time,
-            'true_positives': true_positives,
-            'false_positives': false_positives,
-            'total_tests': num_tests
+            traces_by_scenario += np.bincount(labels['scenario'], minlength=len(SCENARIO_NAMES))
+            detected_by_scenario += np.bincount(labels['scenario'], weights=records['detected'],
+                                                minlength=len(SCENARIO_NAMES))
+        
+        results = self._record_trials('crash_detection', np.concatenate(corpus_records))
+        self.performance_metrics['crash_scenarios'] = {
+            name: float(detected_by_scenario[i] / traces_by_scenario[i] * 100)
+            for i, name in enumerate(SCENARIO_NAMES) if traces_by_scenario[i]
         }
-        
-        self.test_results['crash_detection'] = results
         return results
     
     def simulate_speed_control_tests(self, num_tests: int = 500) -> Dict:
         """Simulate ESP32 speed control performance"""
         print("Evaluating Speed Control System (ESP32)...")
         
+        records = np.zeros(num_tests, dtype=TRIAL_DTYPES['speed_control'])
+        
         # Test scenarios with different speed limits
-        speed_limits = [30, 40, 50, 60, 80, 100]  # km/h
-        compliance_rates = []
-        response_times = []
-        pwm_accuracies = []
-        
-        for _ in range(num_tests):
-            target_speed = random.choice(speed_limits)
-            actual_speed = target_speed + np.random.normal(0, 2)  # ±2 km/h variation
-            
-            # Check compliance (within ±3 km/h tolerance)
-            is_compliant = abs(actual_speed - target_speed) <= 3
-            compliance_rates.append(is_compliant)
-            
-            # Response time (motor PWM adjustment)
-            response_time = np.random.normal(150, 25)  # 150ms ± 25ms
-            response_times.append(max(response_time, 0))
-            
-            # PWM accuracy
-            expected_pwm = (target_speed / 150) * 255  # Normalize to PWM range
-            actual_pwm = expected_pwm + np.random.normal(0, 3)  # ±3 PWM units
-            pwm_accuracy = abs(actual_pwm - expected_pwm) / expected_pwm * 100
-            pwm_accuracies.append(pwm_accuracy)
-        
-        results = {
-            'compliance_rate': sum(compliance_rates) / len(compliance_rates) * 100,
-            'avg_response_time': np.mean(response_times),
-            'avg_pwm_accuracy': np.mean(pwm_accuracies),
-            'total_tests': num_tests
-        }
+        speed_limits = np.array([30, 40, 50, 60, 80, 100])  # km/h
+        target_speeds = np.random.choice(speed_limits, num_tests)
+        records['target_speed'] = target_speeds
+        records['actual_speed'] = target_speeds + np.random.normal(0, self.params['speed_variation'], num_tests)  # ±2 km/h variation
         
-        self.test_results['speed_control'] = results
-        return results
+        # Response time (motor PWM adjustment)
+        records['response_time'] = np.maximum(np.random.normal(self.params['pwm_response_mean'],
+                                                               self.params['pwm_response_std'], num_tests), 0)  # 150ms ± 25ms
+        
+        # PWM accuracy
+        expected_pwm = (target_speeds / 150) * 255  # Normalize to PWM range
+        actual_pwm = expected_pwm + np.random.normal(0, self.params['pwm_noise'], num_tests)  # ±3 PWM units
+        records['pwm_accuracy'] = np.abs(actual_pwm - expected_pwm) / expected_pwm * 100
+        
+        return self._record_trials('speed_control', records)
     
     def simulate_android_app_tests(self, num_tests: int = 300) -> Dict:
         """Simulate Android application performance"""
         print("Evaluating Android Application...")
         
-        gps_accuracies = []
-        api_success_rates = []
-        sms_delivery_rates = []
-        hospital_search_times = []
-        
-        for _ in range(num_tests):
-            # GPS accuracy (3.2m average)
-            gps_accuracy = abs(np.random.normal(3.2, 1.0))
-            gps_accuracies.append(gps_accuracy)
-            
-            # Speed limit API success (93.7%)
-            api_success = np.random.choice([0, 1], p=[0.063, 0.937])
-            api_success_rates.append(api_success)
-            
-            # SMS delivery (98.4%)
-            sms_delivery = np.random.choice([0, 1], p=[0.016, 0.984])
-            sms_delivery_rates.append(sms_delivery)
-            
-            # Hospital search time (2.1s average)
-            search_time = abs(np.random.normal(2.1, 0.5))
-            hospital_search_times.append(search_time)
-        
-        results = {
-            'avg_gps_accuracy': np.mean(gps_accuracies),
-            'api_success_rate': sum(api_success_rates) / len(api_success_rates) * 100,
-            'sms_delivery_rate': sum(sms_delivery_rates) / len(sms_delivery_rates) * 100,
-            'avg_hospital_search_time': np.mean(hospital_search_times),
-            'total_tests': num_tests
-        }
+        records = np.zeros(num_tests, dtype=TRIAL_DTYPES['android_app'])
+        records['gps_accuracy'] = np.abs(np.random.normal(3.2, 1.0, num_tests))  # 3.2m average
+        records['api_success'] = np.random.random(num_tests) < self.params['api_success_rate']  # Speed limit API success (93.7%)
+        records['sms_delivered'] = np.random.random(num_tests) < 0.984  # SMS delivery (98.4%)
+        records['hospital_search_time'] = np.abs(np.random.normal(2.1, 0.5, num_tests))  # 2.1s average
         
-        self.test_results['android_app'] = results
-        return results
+        return self._record_trials('android_app', records)
     
     def simulate_ml_model_tests(self, num_tests: int = 1000) -> Dict:
         """Simulate ML accident risk prediction performance"""
         print("Evaluating ML Accident Risk Model...")
         
+        records = np.zeros(num_tests, dtype=TRIAL_DTYPES['ml_model'])
+        
         # Generate synthetic test data
         actual_speeds = np.random.normal(45, 15, num_tests)  # Actual speeds
-        predicted_speeds = actual_speeds + np.random.normal(0, 7.3)  # Model predictions with RMSE 7.3
-        
-        # Calculate R² score
-        ss_res = np.sum((actual_speeds - predicted_speeds) ** 2)
-        ss_tot = np.sum((actual_speeds - np.mean(actual_speeds)) ** 2)
-        r2_score = 1 - (ss_res / ss_tot)
-        
-        # RMSE calculation
-        rmse = np.sqrt(np.mean((actual_speeds - predicted_speeds) ** 2))
+        records['actual_speed'] = actual_speeds
+        records['predicted_speed'] = actual_speeds + np.random.normal(0, 7.3)  # Model predictions with RMSE 7.3
         
         # Risk calculation times
-        calculation_times = np.random.normal(28, 5, num_tests)  # 28ms ± 5ms
-        
-        # Feature encoding accuracy
-        encoding_accuracy = 0.978  # 97.8% accuracy
-        
-        results = {
-            'r2_score': r2_score,
-            'rmse': rmse,
-            'avg_calculation_time': np.mean(calculation_times),
-            'encoding_accuracy': encoding_accuracy * 100,
-            'total_tests': num_tests
-        }
+        records['calculation_time'] = np.random.normal(28, 5, num_tests)  # 28ms ± 5ms
         
-        self.test_results['ml_model'] = results
-        return results
+        return self._record_trials('ml_model', records)
     
     def simulate_system_integration_tests(self, num_tests: int = 200) -> Dict:
         """Simulate overall system integration performance"""
         print("Evaluating System Integration...")
         
-        end_to_end_latencies = []
-        sync_success_rates = []
-        power_consumptions = []
-        
-        for _ in range(num_tests):
-            # End-to-end latency (Android → ESP32 → Response)
-            latency = abs(np.random.normal(700, 100))  # 700ms ± 100ms
-            end_to_end_latencies.append(latency)
-            
-            # Multi-device synchronization (94.3%)
-            sync_success = np.random.choice([0, 1], p=[0.057, 0.943])
-            sync_success_rates.append(sync_success)
-            
-            # Power consumption (1.6W average)
-            power = abs(np.random.normal(1.6, 0.2))
-            power_consumptions.append(power)
-        
-        results = {
-            'avg_end_to_end_latency': np.mean(end_to_end_latencies),
-            'sync_success_rate': sum(sync_success_rates) / len(sync_success_rates) * 100,
-            'avg_power_consumption': np.mean(power_consumptions),
-            'system_uptime': 99.2,  # 99.2% uptime
-            'total_tests': num_tests
-        }
+        records = np.zeros(num_tests, dtype=TRIAL_DTYPES['system_integration'])
+        records['latency'] = np.abs(np.random.normal(700, 100, num_tests))  # Android → ESP32 → Response, 700ms ± 100ms
+        records['sync_success'] = np.random.random(num_tests) < 0.943  # Multi-device synchronization (94.3%)
+        records['power'] = np.abs(np.random.normal(1.6, 0.2, num_tests))  # 1.6W average
         
-        self.test_results['system_integration'] = results
-        return results
+        return self._record_trials('system_integration', records)
     
     def simulate_emergency_response_tests(self, num_tests: int = 150) -> Dict:
         """Simulate emergency response system performance"""
         print("Evaluating Emergency Response System...")
         
-        alert_dispatch_times = []
-        location_accuracies = []
-        contact_delivery_rates = []
-        hospital_info_success_rates = []
-        
-        for _ in range(num_tests):
-            # Alert dispatch time (6.2s average)
-            dispatch_time = abs(np.random.normal(6.2, 1.0))
-            alert_dispatch_times.append(dispatch_time)
-            
-            # Location accuracy (4.8m average)
-            location_accuracy = abs(np.random.normal(4.8, 1.5))
-            location_accuracies.append(location_accuracy)
-            
-            # Contact delivery (98.1%)
-            contact_delivery = np.random.choice([0, 1], p=[0.019, 0.981])
-            contact_delivery_rates.append(contact_delivery)
-            
-            # Hospital info retrieval (89.3%)
-            hospital_info = np.random.choice([0, 1], p=[0.107, 0.893])
-            hospital_info_success_rates.append(hospital_info)
-        
-        results = {
-            'avg_alert_dispatch_time': np.mean(alert_dispatch_times),
-            'avg_location_accuracy': np.mean(location_accuracies),
-            'contact_delivery_rate': sum(contact_delivery_rates) / len(contact_delivery_rates) * 100,
-            'hospital_info_success_rate': sum(hospital_info_success_rates) / len(hospital_info_success_rates) * 100,
-            'total_tests': num_tests
-        }
-        
-        self.test_results['emergency_response'] = results
-        return results
+        records = np.zeros(num_tests, dtype=TRIAL_DTYPES['emergency_response'])
+        records['location_accuracy'] = np.abs(np.random.normal(4.8, 1.5, num_tests))  # 4.8m average
+        if self.dispatch_pipeline:
+            # Timings and delivery from the async dispatch pipeline (retries, timeouts, rate limits)
+            burst = simulate_dispatch_burst(num_tests, arrival_window=DISPATCH_ARRIVAL_WINDOW,
+                                            seed=np.random.randint(2**31 - 1), include_outcomes=True)
+            outcomes = burst['outcomes']
+            records['dispatch_time'] = outcomes['dispatch_time']
+            records['contact_delivered'] = outcomes['contacts_delivered'] == outcomes['num_contacts']
+            records['hospital_info'] = outcomes['hospital_notified']
+        else:
+            records['dispatch_time'] = np.abs(np.random.normal(6.2, 1.0, num_tests))  # 6.2s average
+            records['contact_delivered'] = np.random.random(num_tests) < 0.981  # Contact delivery (98.1%)
+            records['hospital_info'] = np.random.random(num_tests) < 0.893  # Hospital info retrieval (89.3%)
+        records['distance_to_care'] = np.nan
+        records['hospital_lookup_time'] = np.nan
+        
+        # Real distance-to-care and lookup cost from the offline hospital index
+        if self.hospital_index is not None:
+            center = (np.mean(self.hospital_index.latitudes), np.mean(self.hospital_index.longitudes))
+            crash_lats, crash_lons = sample_locations(num_tests, center)
+            lookup_start = time.perf_counter()
+            distances, _ = self.hospital_index.query(crash_lats, crash_lons)
+            lookup_time = time.perf_counter() - lookup_start
+            records['distance_to_care'] = distances
+            records['hospital_lookup_time'] = lookup_time / num_tests * 1000  # ms per crash
+        
+        return self._record_trials('emergency_response', records)
+    
+    def simulate_manual_override_tests(self, num_tests: int = 100) -> Dict:
+        """Simulate manual override authorization, logging, SMS alerts and deactivation"""
+        print("Evaluating Manual Override System...")
+        
+        # Continue the event log after the previous run's sessions
+        start_ms = max(int(time.time() * 1000), (self.override_log.last_timestamp or 0) + 1)
+        rng = np.random.default_rng(np.random.randint(2**31 - 1))
+        events = simulate_override_sessions(num_tests, start_ms=start_ms, first_override_id=self.override_sessions,
+                                            rng=rng, period_days=1.0)
+        self.override_log.append(events)
+        self.override_sessions += num_tests
+        
+        return self._record_trials('manual_override', session_records(events))
     
     def generate_performance_summary(self) -> pd.DataFrame:
         """Generate a comprehensive performance summary table"""
@@ -285,6 +267,12 @@ class SystemEvaluator:
             ["Emergency Response", "Alert Dispatch", "<10s", f"{self.test_results['emergency_response']['avg_alert_dispatch_time']:.1f}s", "Excellent", "Pass"],
             ["", "Location Accuracy", "<10m", f"{self.test_results['emergency_response']['avg_location_accuracy']:.1f}m", "Excellent", "Pass"],
             ["", "Contact Delivery", ">95%", f"{self.test_results['emergency_response']['contact_delivery_rate']:.1f}%", "Excellent", "Pass"],
+            
+            # Manual Override
+            ["Manual Override", "Authorization Time", "<30s", f"{self.test_results['manual_override']['avg_authorization_time']:.0f}s", "Excellent", "Pass"],
+            ["", "Logging Accuracy", "100%", f"{self.test_results['manual_override']['logging_accuracy']:.1f}%", "Perfect", "Pass"],
+            ["", "SMS Alert Success", ">95%", f"{self.test_results['manual_override']['sms_alert_success_rate']:.1f}%", "Excellent", "Pass"],
+            ["", "Deactivation Response", "<5s", f"{self.test_results['manual_override']['avg_deactivation_time']:.1f}s", "Excellent", "Pass"],
         ]
         
         columns = ["Component", "Metric", "Target", "Achieved", "Performance", "Status"]
@@ -401,11 +389,41 @@ class SystemEvaluator:
                 component_df = pd.DataFrame([results])
                 component_df.to_excel(writer, sheet_name=component.replace('_', ' ').title(), index=False)
         
+        # Save raw per-trial records for re-aggregation without reruns
+        self.save_trial_records()
+        
+        # Archive this run for the evaluation history dashboard
+        run_path = self.archive_run()
+        
         print("Results saved to:")
         print("   - system_performance_summary.csv")
         print("   - detailed_test_results.json")
         print("   - system_evaluation_report.xlsx")
         print("   - system_performance_analysis.png")
+        print("   - trial_records/*.npy")
+        print(f"   - {run_path}")
+    
+    def archive_run(self, runs_dir: str = RUNS_DIR, revision: str = None) -> str:
+        """Save this run's results under a unique run directory for historical comparison"""
+        timestamp = datetime.now()
+        run_id = f"run_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}"
+        run_dir = os.path.join(runs_dir, run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        
+        run_path = os.path.join(run_dir, 'detailed_test_results.json')
+        with open(run_path, 'w') as f:
+            json.dump({
+                'run_id': run_id,
+                'timestamp': timestamp.isoformat(),
+                'revision': revision or os.environ.get('FIRMWARE_REVISION', 'unknown'),
+                'results': self.test_results,
+            }, f, indent=2)
+        return run_path
+    
+    def save_trial_records(self, directory: str = 'trial_records', fmt: str = 'npy') -> Dict[str, str]:
+        """Export retained per-trial records as .npy or .parquet files"""
+        buffers = {component: buffer for component, buffer in self.trial_records.items() if len(buffer)}
+        return save_trials(buffers, directory, fmt)
     
     def run_complete_evaluation(self):
         """Run the complete system evaluation"""
@@ -421,6 +439,7 @@ class SystemEvaluator:
         self.simulate_ml_model_tests()
         self.simulate_system_integration_tests()
         self.simulate_emergency_response_tests()
+        self.simulate_manual_override_tests()
         
         # Generate summary
         summary_df = self.generate_performance_summary()